@@ -3,19 +3,21 @@
 from __future__ import annotations
 
 import functools
+import json
 import os
-import re
 import string
 import sys
 import threading
-import traceback
-from collections.abc import Callable, Generator, Mapping
+from collections.abc import Callable, Generator, Iterable, Mapping
 from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
+from types import CodeType, MappingProxyType
 from typing import TYPE_CHECKING, Any, TextIO, cast
 
 from ._logust import LogLevel, PyLogger
-from ._template import CALLER_TOKENS, KNOWN_TOKENS, ParsedCallableTemplate
+from ._sink_queue import SinkQueue
+from ._template import CALLER_TOKENS, get_template
 
 
 @dataclass(frozen=True, slots=True)
@@ -72,11 +74,6 @@ class CollectOptions:
     process: bool | ProcessInfo | None = None
 
 
-# Token pattern for format analysis (matches known tokens only)
-# Built from KNOWN_TOKENS to ensure consistency with ParsedCallableTemplate
-_FORMAT_TOKEN_PATTERN = re.compile(
-    r"\{(" + "|".join(re.escape(t) for t in KNOWN_TOKENS) + r"|extra\[[^\]]+\])(?::[^}]+)?\}"
-)
 _FORMATTER = string.Formatter()
 
 
@@ -137,12 +134,8 @@ def _collect_options_from_format(format_str: str) -> CollectOptions:
     Returns:
         CollectOptions with explicit True/False values based on format needs.
     """
-    used_tokens: set[str] = set()
-    for match in _FORMAT_TOKEN_PATTERN.finditer(format_str):
-        key = match.group(1)
-        if key.startswith("extra["):
-            key = "extra"
-        used_tokens.add(key)
+    # Reuse the callable-template tokenizer so both agree on what a token is
+    used_tokens = get_template(format_str).needed_tokens
 
     needs_caller = bool(used_tokens & CALLER_TOKENS)
     needs_thread = "thread" in used_tokens
@@ -155,12 +148,54 @@ def _collect_options_from_format(format_str: str) -> CollectOptions:
     )
 
 
+# Default template for callable sinks (mirrors the Rust default file/console format)
+_DEFAULT_CALLABLE_FORMAT = "{time} | {level:<8} | {name}:{function}:{line} - {message}"
+
+
+def _serialize_callable_record(record: dict[str, Any]) -> str:
+    """Render a record as JSON matching Rust's ``format_record_json``."""
+    json_record: dict[str, Any] = {
+        "time": record.get("timestamp", ""),
+        "level": record.get("level", ""),
+        "message": record.get("message", ""),
+    }
+    # Only include non-empty caller info
+    if record.get("name"):
+        json_record["name"] = record["name"]
+    if record.get("function"):
+        json_record["function"] = record["function"]
+    if record.get("line"):
+        json_record["line"] = record["line"]
+    # Include extra if non-empty
+    extra = record.get("extra", {})
+    if extra:
+        json_record["extra"] = extra
+    # Include exception if present
+    if record.get("exception"):
+        json_record["exception"] = record["exception"]
+    return json.dumps(json_record)
+
+
 if TYPE_CHECKING:
     from ._opt import OptLogger
 
-# Cached process info (invalidated on fork by checking PID)
+# Cached process info, reset in forked children so they report their own PID
 _CACHED_PROCESS_INFO: tuple[str, int] | None = None
-_CACHED_PROCESS_PID: int | None = None
+
+
+def _reset_process_info() -> None:
+    global _CACHED_PROCESS_INFO
+    _CACHED_PROCESS_INFO = None
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_process_info)
+
+
+# id(code) -> (code, f_globals, module_name, file_basename) for recent callers.
+# Bounded so eval'd / dynamically created code cannot grow it without limit.
+_CALLER_CODE_CACHE: dict[int, tuple[CodeType, dict[str, Any], str, str]] = {}
+_CALLER_CODE_CACHE_MAX = 4096
 
 
 def _get_caller_info(depth: int = 1) -> tuple[str, str, int, str]:
@@ -175,11 +210,23 @@ def _get_caller_info(depth: int = 1) -> tuple[str, str, int, str]:
     try:
         frame = sys._getframe(depth + 1)  # +1 to skip this function itself
         code = frame.f_code
-        # Get module name from globals, or use filename as fallback
-        module_name = frame.f_globals.get("__name__", code.co_filename)
-        # Get file basename (not full path)
-        file_basename = os.path.basename(code.co_filename)
-        return (module_name, code.co_name, frame.f_lineno, file_basename)
+        f_globals = frame.f_globals
+        cached = _CALLER_CODE_CACHE.get(id(code))
+        # The entry holds the code object and globals it was built from, so a
+        # recycled id() or code exec'd under other globals never hits a stale entry.
+        if cached is None or cached[0] is not code or cached[1] is not f_globals:
+            if len(_CALLER_CODE_CACHE) >= _CALLER_CODE_CACHE_MAX:
+                _CALLER_CODE_CACHE.clear()
+            cached = (
+                code,
+                f_globals,
+                # Module name from globals, or filename as fallback
+                f_globals.get("__name__", code.co_filename),
+                # File basename (not full path)
+                os.path.basename(code.co_filename),
+            )
+            _CALLER_CODE_CACHE[id(code)] = cached
+        return (cached[2], code.co_name, frame.f_lineno, cached[3])
     except (ValueError, AttributeError):
         return ("", "", 0, "")
 
@@ -197,69 +244,195 @@ def _get_thread_info() -> tuple[str, int]:
 def _get_process_info() -> tuple[str, int]:
     """Get current process name and ID.
 
-    Caches the result, but invalidates cache after fork (detected by PID change).
+    Caches the result; the cache is reset in the child after ``fork()``, so
+    the hot path does not need an ``os.getpid()`` call per record.
 
     Returns:
         Tuple of (process_name, process_id)
     """
-    global _CACHED_PROCESS_INFO, _CACHED_PROCESS_PID
-    current_pid = os.getpid()
-
-    # Invalidate cache if PID changed (fork occurred)
-    if _CACHED_PROCESS_INFO is not None and _CACHED_PROCESS_PID == current_pid:
+    global _CACHED_PROCESS_INFO
+    if _CACHED_PROCESS_INFO is not None:
         return _CACHED_PROCESS_INFO
 
-    try:
-        import multiprocessing
+    current_pid = os.getpid()
 
-        name = multiprocessing.current_process().name
-    except Exception:
-        name = "MainProcess"
+    # Processes started by multiprocessing always have it imported; otherwise
+    # current_process() would report the default name, so skip the import.
+    multiprocessing = sys.modules.get("multiprocessing")
+    name = "MainProcess"
+    if multiprocessing is not None:
+        try:
+            name = multiprocessing.current_process().name
+        except Exception:
+            pass
     _CACHED_PROCESS_INFO = (name, current_pid)
-    _CACHED_PROCESS_PID = current_pid
     return _CACHED_PROCESS_INFO
 
 
+# (name, function, line, file, thread_name, thread_id, process_name, process_id)
+_RecordInfo = tuple[
+    str | None, str | None, int | None, str | None, str | None, int | None, str | None, int | None
+]
+
+
+def _resolve_record_info(
+    needs_caller: bool | CallerInfo,
+    needs_thread: bool | ThreadInfo,
+    needs_process: bool | ProcessInfo,
+    depth: int,
+) -> _RecordInfo:
+    """Resolve the caller, thread, and process fields for a ``PyLogger`` emit call.
+
+    ``True`` collects the value now, a fixed ``CallerInfo`` / ``ThreadInfo`` /
+    ``ProcessInfo`` is used as-is, and ``False`` leaves the fields unset.
+
+    Args:
+        needs_caller: Caller requirement from ``_compute_effective_requirements``.
+        needs_thread: Thread requirement from ``_compute_effective_requirements``.
+        needs_process: Process requirement from ``_compute_effective_requirements``.
+        depth: Frames to go back from the caller of this function to the call site.
+
+    Returns:
+        Tuple of (name, function, line, file, thread_name, thread_id,
+        process_name, process_id).
+    """
+    name: str | None
+    function: str | None
+    line: int | None
+    file: str | None
+    if needs_caller is True:
+        name, function, line, file = _get_caller_info(depth + 1)
+    elif needs_caller is not False:
+        name, function, line, file = (
+            needs_caller.name,
+            needs_caller.function,
+            needs_caller.line,
+            needs_caller.file,
+        )
+    else:
+        name, function, line, file = None, None, None, None
+
+    thread_name: str | None
+    thread_id: int | None
+    if needs_thread is True:
+        thread_name, thread_id = _get_thread_info()
+    elif needs_thread is not False:
+        thread_name, thread_id = needs_thread.name, needs_thread.id
+    else:
+        thread_name, thread_id = None, None
+
+    process_name: str | None
+    process_id: int | None
+    if needs_process is True:
+        process_name, process_id = _get_process_info()
+    elif needs_process is not False:
+        process_name, process_id = needs_process.name, needs_process.id
+    else:
+        process_name, process_id = None, None
+
+    return (name, function, line, file, thread_name, thread_id, process_name, process_id)
+
+
 def _to_log_level(level: LogLevel | str) -> LogLevel:
     """Convert string level name to LogLevel enum."""
-    if isinstance(level, str):
-        return getattr(LogLevel, level.capitalize())  # type: ignore[no-any-return]
-    return level
-
-
-try:
-    _LEVEL_VALUES: dict[str, int] = {
-        "trace": LogLevel.Trace.value,
-        "debug": LogLevel.Debug.value,
-        "info": LogLevel.Info.value,
-        "success": LogLevel.Success.value,
-        "warning": LogLevel.Warning.value,
-        "error": LogLevel.Error.value,
-        "fail": LogLevel.Fail.value,
-        "critical": LogLevel.Critical.value,
+    if not isinstance(level, str):
+        return level
+    try:
+        return _LEVEL_NAME_TO_ENUM[level]
+    except KeyError:
+        pass
+    try:
+        return _LEVEL_NAME_TO_ENUM[level.lower()]
+    except KeyError:
+        # AttributeError matches the historical getattr(LogLevel, ...) failure
+        raise AttributeError(f"Unknown log level: {level!r}") from None
+
+
+# Built-in level name -> numeric value, read once from the Rust enum. A missing
+# variant fails the import loudly instead of silently using stale numbers.
+_LEVEL_VALUES: Mapping[str, int] = MappingProxyType(
+    {
+        name: getattr(LogLevel, name.capitalize()).value
+        for name in ("trace", "debug", "info", "success", "warning", "error", "fail", "critical")
     }
-except (AttributeError, TypeError):
-    import warnings
+)
 
-    warnings.warn(
-        "LogLevel enum access failed, using static fallback values",
-        RuntimeWarning,
-        stacklevel=1,
-    )
-    _LEVEL_VALUES = {
-        "trace": 5,
-        "debug": 10,
-        "info": 20,
-        "success": 25,
-        "warning": 30,
-        "error": 40,
-        "fail": 45,
-        "critical": 50,
+# Interned spellings of each built-in level name. Source literals such as ``"INFO"`` are
+# interned already, so table lookups keyed by these hit the identity fast path.
+_LEVEL_SPELLINGS: dict[str, tuple[str, str, str]] = {
+    name: (name, sys.intern(name.upper()), sys.intern(name.capitalize())) for name in _LEVEL_VALUES
+}
+
+# Upper-case record names handed to patchers, so ``_apply_patchers`` skips ``str.upper()``
+_LEVEL_UPPER_NAMES: dict[str, str] = {
+    name: spellings[1] for name, spellings in _LEVEL_SPELLINGS.items()
+}
+
+# Built-in level names in every common spelling -> LogLevel, used by ``_to_log_level``
+_LEVEL_NAME_TO_ENUM: dict[str, LogLevel] = {
+    spelling: getattr(LogLevel, spellings[2])
+    for spellings in _LEVEL_SPELLINGS.values()
+    for spelling in spellings
+}
+
+if len(set(_LEVEL_VALUES.values())) != len(_LEVEL_VALUES):
+    raise ValueError("Duplicate numeric level values detected")
+
+# Single-lookup dispatch for ``log()``: names and numeric values of the built-in
+# levels map to ``(level_value, method_name)``. Names are keyed in lower, upper,
+# and capitalized form so the usual spellings skip the ``str.lower()`` allocation.
+_LEVEL_DISPATCH: Mapping[str | int, tuple[int, str]] = MappingProxyType(
+    {
+        **{
+            spelling: (value, name)
+            for name, value in _LEVEL_VALUES.items()
+            for spelling in _LEVEL_SPELLINGS[name]
+        },
+        **{value: (value, name) for name, value in _LEVEL_VALUES.items()},
     }
+)
+
+
+def _builtin_level(level: object) -> tuple[int, str] | None:
+    """Return ``(level_value, method_name)`` for a built-in level name or number."""
+    if isinstance(level, str):
+        builtin = _LEVEL_DISPATCH.get(level)
+        return builtin if builtin is not None else _LEVEL_DISPATCH.get(level.lower())
+    if isinstance(level, int):
+        return _LEVEL_DISPATCH.get(level)
+    return None
 
-_LEVEL_VALUE_MAP: dict[int, str] = {v: k for k, v in _LEVEL_VALUES.items()}
-if len(_LEVEL_VALUE_MAP) != len(_LEVEL_VALUES):
-    raise ValueError("Duplicate numeric level values detected")
+
+class _LazyLevelMethods(dict[str, Callable[..., None]]):
+    """Level methods of a ``PyLogger``, bound on first use.
+
+    Every ``Logger`` (including ``bind()`` / ``patch()`` / ``opt()`` children) and
+    every ``contextualize()`` block builds one, and most log at one or two levels,
+    so binding all eight up front is waste.
+    """
+
+    __slots__ = ("_inner",)
+
+    def __init__(self, inner: PyLogger) -> None:
+        super().__init__()
+        self._inner = inner
+
+    def __missing__(self, name: str) -> Callable[..., None]:
+        method: Callable[..., None] = getattr(self._inner, name)
+        self[name] = method
+        return method
+
+
+# Per-task ``contextualize`` overrides keyed by the ``Logger`` they apply to. Values hold the
+# bound ``PyLogger``, its cached level methods and the merged context, in that order.
+_ContextState = tuple[PyLogger, dict[str, Callable[..., None]], dict[str, Any]]
+_CONTEXTUALIZED: ContextVar[dict[Logger, _ContextState] | None] = ContextVar(
+    "logust_contextualized", default=None
+)
+
+
+# Shared patcher tuple of loggers without patchers; ``if self._patchers`` is the fast path
+_EMPTY_PATCHERS: tuple[Callable[[dict[str, Any]], None], ...] = ()
 
 # ``u32::MAX`` — matches Rust conservative merge for unknown emit severity.
 _EMIT_NO_SUPERSET: int = 4_294_967_295
@@ -287,10 +460,28 @@ class Logger:
     - Record patching
     """
 
+    # ``bind()`` / ``patch()`` create a Logger per call; slots keep them small.
+    # ``__weakref__`` is kept so instances remain weak-referenceable.
+    __slots__ = (
+        "__weakref__",
+        "_aggregated_options_box",
+        "_callback_ids",
+        "_collect_options",
+        "_context",
+        "_filter_ids",
+        "_inner",
+        "_inner_methods",
+        "_min_level_box",
+        "_patchers",
+        "_raw_callback_ids",
+        "_requirements_cache_box",
+        "_sink_queues",
+    )
+
     def __init__(
         self,
         inner: PyLogger,
-        patchers: list[Callable[[dict[str, Any]], None]] | None = None,
+        patchers: Iterable[Callable[[dict[str, Any]], None]] | None = None,
         context: dict[str, Any] | None = None,
         collect_options: dict[int, CollectOptions] | None = None,
         callback_ids: set[int] | None = None,
@@ -322,9 +513,16 @@ class Logger:
             ]
             | None
         ) = None,
+        min_level_box: list[int] | None = None,
+        sink_queues: dict[int, SinkQueue] | None = None,
     ) -> None:
         self._inner = inner
-        self._patchers = patchers if patchers is not None else []
+        # Level methods of ``_inner``, bound on first use; replaced when ``_inner`` is swapped
+        self._inner_methods = _LazyLevelMethods(inner)
+        # Immutable so bound loggers can share it; empty loggers share ``_EMPTY_PATCHERS``
+        self._patchers: tuple[Callable[[dict[str, Any]], None], ...] = (
+            tuple(patchers) if patchers else _EMPTY_PATCHERS
+        )
         self._context = dict(context or {})
         # Handler ID -> CollectOptions mapping (shared between bound loggers)
         # Use explicit None check to preserve empty containers (empty dict/set are falsy)
@@ -339,6 +537,8 @@ class Logger:
         self._raw_callback_ids: set[int] = (
             raw_callback_ids if raw_callback_ids is not None else set()
         )
+        # Background queues of callable sinks added with ``enqueue=True``
+        self._sink_queues: dict[int, SinkQueue] = sink_queues if sink_queues is not None else {}
         # Cached requirements in a box (list) for sharing between bound loggers
         # Box[0] is ``emit_no -> (caller, thread, process)`` or None if invalid
         self._requirements_cache_box: list[
@@ -368,11 +568,18 @@ class Logger:
             ]
             | None
         ] = aggregated_options_box if aggregated_options_box is not None else [None]
+        # Mirror of Rust ``min_level`` in a box shared between bound loggers, so the
+        # disabled-level check is a plain list read instead of a PyO3 property call.
+        # Refreshed by ``_invalidate_requirements_cache`` whenever handlers change.
+        self._min_level_box: list[int] = (
+            min_level_box if min_level_box is not None else [inner.min_level]
+        )
 
     def _invalidate_requirements_cache(self) -> None:
-        """Invalidate all caches (call when handlers change)."""
+        """Invalidate all caches and refresh the min level (call when handlers change)."""
         self._requirements_cache_box[0] = None
         self._aggregated_options_box[0] = None
+        self._min_level_box[0] = self._inner.min_level
 
     def _get_aggregated_options(
         self,
@@ -608,6 +815,15 @@ class Logger:
         cache_dict[eff_emit] = result
         return result
 
+    def _current(self) -> _ContextState:
+        """Return the inner logger, level methods and context active in this context."""
+        overrides = _CONTEXTUALIZED.get()
+        if overrides is not None:
+            state = overrides.get(self)
+            if state is not None:
+                return state
+        return self._inner, self._inner_methods, self._context
+
     def _apply_patchers(
         self,
         *,
@@ -617,18 +833,19 @@ class Logger:
         exception: str | None,
         extra: dict[str, Any] | None,
     ) -> tuple[str, str | None, dict[str, Any] | None]:
-        """Apply registered patchers before the record reaches handlers."""
-        message_str = message if isinstance(message, str) else str(message)
-        if not self._patchers:
-            return message_str, exception, extra
+        """Apply registered patchers before the record reaches handlers.
 
-        base_extra = dict(self._context)
+        Only called when ``self._patchers`` is non-empty; without patchers the emit
+        paths just normalize the message to ``str`` themselves.
+        """
+        message_str = message if type(message) is str else str(message)
+        base_extra = dict(self._current()[2])
         if extra:
             base_extra.update(extra)
         original_extra_keys = {str(key) for key in base_extra}
 
         record: dict[str, Any] = {
-            "level": level_name.upper(),
+            "level": _LEVEL_UPPER_NAMES.get(level_name) or level_name.upper(),
             "level_no": level_no,
             "message": message_str,
             "timestamp": "",
@@ -670,35 +887,40 @@ class Logger:
         depth: int,
         kwargs: dict[str, Any] | None = None,
     ) -> None:
-        if level_value < self._inner.min_level:
-            return
-
+        # Callers check ``level_value`` against ``_min_level_box`` before calling
         extra_kwargs: dict[str, Any] | None = None
         if kwargs:
             message, extra_kwargs = _split_kwargs_for_format(message, kwargs)
             if not extra_kwargs:
                 extra_kwargs = None
 
-        message, exception, extra_kwargs = self._apply_patchers(
-            level_name=level_name,
-            level_no=level_value,
-            message=message,
-            exception=exception,
-            extra=extra_kwargs,
+        if self._patchers:
+            message, exception, extra_kwargs = self._apply_patchers(
+                level_name=level_name,
+                level_no=level_value,
+                message=message,
+                exception=exception,
+                extra=extra_kwargs,
+            )
+        elif type(message) is not str:
+            message = str(message)
+
+        inner, inner_methods, _ = self._current()
+        emit = (
+            inner_methods[level_name]
+            if extra_kwargs is None
+            else getattr(inner.bind(extra_kwargs), level_name)
         )
 
-        inner = self._inner if extra_kwargs is None else self._inner.bind(extra_kwargs)
-
         # Compute effective requirements considering CollectOptions
         needs_caller, needs_thread, needs_process = self._compute_effective_requirements(
             level_value
         )
 
+        # Arguments are passed positionally in the order of the ``PyLogger`` level
+        # methods' signature, which spares PyO3 the keyword-to-slot matching.
         if needs_caller is False and needs_thread is False and needs_process is False:
-            if exception is None:
-                getattr(inner, level_name)(str(message))
-            else:
-                getattr(inner, level_name)(str(message), exception=exception)
+            emit(message, exception)
             return
 
         if needs_thread is False and needs_process is False:
@@ -713,132 +935,77 @@ class Logger:
                     needs_caller.line,
                     needs_caller.file,
                 )
-            if exception is None:
-                getattr(inner, level_name)(
-                    str(message), name=name, function=function, line=line, file=file
-                )
-            else:
-                getattr(inner, level_name)(
-                    str(message),
-                    exception=exception,
-                    name=name,
-                    function=function,
-                    line=line,
-                    file=file,
-                )
+            emit(message, exception, name, function, line, file)
             return
 
-        # Handle caller info
-        c_name: str | None
-        c_function: str | None
-        c_line: int | None
-        c_file: str | None
-        if needs_caller is True:
-            c_name, c_function, c_line, c_file = _get_caller_info(depth + 1)
-        elif needs_caller is not False:
-            c_name, c_function, c_line, c_file = (
-                needs_caller.name,
-                needs_caller.function,
-                needs_caller.line,
-                needs_caller.file,
-            )
-        else:
-            c_name, c_function, c_line, c_file = None, None, None, None
-
-        # Handle thread info
-        t_name: str | None
-        t_id: int | None
-        if needs_thread is True:
-            t_name, t_id = _get_thread_info()
-        elif needs_thread is not False:
-            t_name = needs_thread.name
-            t_id = needs_thread.id
-        else:
-            t_name, t_id = None, None
-
-        # Handle process info
-        p_name: str | None
-        p_id: int | None
-        if needs_process is True:
-            p_name, p_id = _get_process_info()
-        elif needs_process is not False:
-            p_name = needs_process.name
-            p_id = needs_process.id
-        else:
-            p_name, p_id = None, None
-
-        if exception is None:
-            getattr(inner, level_name)(
-                str(message),
-                name=c_name,
-                function=c_function,
-                line=c_line,
-                file=c_file,
-                thread_name=t_name,
-                thread_id=t_id,
-                process_name=p_name,
-                process_id=p_id,
-            )
-        else:
-            getattr(inner, level_name)(
-                str(message),
-                exception=exception,
-                name=c_name,
-                function=c_function,
-                line=c_line,
-                file=c_file,
-                thread_name=t_name,
-                thread_id=t_id,
-                process_name=p_name,
-                process_id=p_id,
-            )
+        emit(
+            message,
+            exception,
+            *_resolve_record_info(needs_caller, needs_thread, needs_process, depth + 1),
+        )
 
     def trace(
         self, message: str, *, exception: str | None = None, _depth: int = 0, **kwargs: Any
     ) -> None:
         """Output TRACE level log message."""
+        if 5 < self._min_level_box[0]:
+            return
         self._log_with_level(5, "trace", message, exception, _depth + 1, kwargs)
 
     def debug(
         self, message: str, *, exception: str | None = None, _depth: int = 0, **kwargs: Any
     ) -> None:
         """Output DEBUG level log message."""
+        if 10 < self._min_level_box[0]:
+            return
         self._log_with_level(10, "debug", message, exception, _depth + 1, kwargs)
 
     def info(
         self, message: str, *, exception: str | None = None, _depth: int = 0, **kwargs: Any
     ) -> None:
         """Output INFO level log message."""
+        if 20 < self._min_level_box[0]:
+            return
         self._log_with_level(20, "info", message, exception, _depth + 1, kwargs)
 
     def success(
         self, message: str, *, exception: str | None = None, _depth: int = 0, **kwargs: Any
     ) -> None:
         """Output SUCCESS level log message."""
+        if 25 < self._min_level_box[0]:
+            return
         self._log_with_level(25, "success", message, exception, _depth + 1, kwargs)
 
     def warning(
         self, message: str, *, exception: str | None = None, _depth: int = 0, **kwargs: Any
     ) -> None:
         """Output WARNING level log message."""
+        if 30 < self._min_level_box[0]:
+            return
         self._log_with_level(30, "warning", message, exception, _depth + 1, kwargs)
 
     def error(
         self, message: str, *, exception: str | None = None, _depth: int = 0, **kwargs: Any
     ) -> None:
         """Output ERROR level log message."""
+        if 40 < self._min_level_box[0]:
+            return
         self._log_with_level(40, "error", message, exception, _depth + 1, kwargs)
 
     def fail(
         self, message: str, *, exception: str | None = None, _depth: int = 0, **kwargs: Any
     ) -> None:
         """Output FAIL level log message."""
+        if 45 < self._min_level_box[0]:
+            return
         self._log_with_level(45, "fail", message, exception, _depth + 1, kwargs)
 
     def critical(
         self, message: str, *, exception: str | None = None, _depth: int = 0, **kwargs: Any
     ) -> None:
         """Output CRITICAL level log message."""
+        if 50 < self._min_level_box[0]:
+            return
         self._log_with_level(50, "critical", message, exception, _depth + 1, kwargs)
 
     def exception(self, message: str, *, _depth: int = 0, **kwargs: Any) -> None:
@@ -859,12 +1026,17 @@ class Logger:
             ...     logger.exception("Operation failed")
             # Output: ERROR with full traceback
         """
+        # ERROR disabled everywhere: skip stringifying the traceback entirely
+        if 40 < self._min_level_box[0]:
+            return
         exc_info = sys.exc_info()
         if exc_info[0] is not None:
+            import traceback
+
             tb = traceback.format_exc()
-            self.error(message, exception=tb, _depth=_depth + 1, **kwargs)
+            self._log_with_level(40, "error", message, tb, _depth + 1, kwargs)
         else:
-            self.error(message, _depth=_depth + 1, **kwargs)
+            self._log_with_level(40, "error", message, None, _depth + 1, kwargs)
 
     def level(
         self,
@@ -911,41 +1083,33 @@ class Logger:
             >>> logger.log("INFO", "Using built-in level by name")
             >>> logger.log(20, "Using built-in level by number")
         """
-        if isinstance(level, str):
-            level_lower = level.lower()
-            if level_lower in _LEVEL_VALUES:
-                self._log_with_level(
-                    _LEVEL_VALUES[level_lower],
-                    level_lower,
-                    message,
-                    exception,
-                    _depth + 1,
-                    kwargs,
-                )
+        builtin = _builtin_level(level)
+        if builtin is not None:
+            level_value, level_name = builtin
+            if level_value < self._min_level_box[0]:
                 return
-        elif isinstance(level, int) and level in _LEVEL_VALUE_MAP:
-            self._log_with_level(
-                level, _LEVEL_VALUE_MAP[level], message, exception, _depth + 1, kwargs
-            )
+            self._log_with_level(level_value, level_name, message, exception, _depth + 1, kwargs)
             return
 
         resolved_emit = self._inner.try_resolve_emit_level_no(level)
         if resolved_emit is None:
             extra_kw: dict[str, Any] | None = None
-            message, exception, extra_kw = self._apply_patchers(
-                level_name=str(level),
-                level_no=0,
-                message=message,
-                exception=exception,
-                extra=extra_kw,
-            )
-            inner = self._inner if extra_kw is None else self._inner.bind(extra_kw)
-            if exception is None:
-                inner.log(level, str(message))
-            else:
-                inner.log(level, str(message), exception=exception)
+            if self._patchers:
+                message, exception, extra_kw = self._apply_patchers(
+                    level_name=str(level),
+                    level_no=0,
+                    message=message,
+                    exception=exception,
+                    extra=extra_kw,
+                )
+            elif type(message) is not str:
+                message = str(message)
+            inner = self._current()[0]
+            if extra_kw is not None:
+                inner = inner.bind(extra_kw)
+            inner.log(level, message, exception)
             return
-        if resolved_emit < self._inner.min_level:
+        if resolved_emit < self._min_level_box[0]:
             return
 
         extra_kw = None
@@ -954,24 +1118,27 @@ class Logger:
             if not extra_kw:
                 extra_kw = None
 
-        message, exception, extra_kw = self._apply_patchers(
-            level_name=str(level),
-            level_no=resolved_emit,
-            message=message,
-            exception=exception,
-            extra=extra_kw,
-        )
+        if self._patchers:
+            message, exception, extra_kw = self._apply_patchers(
+                level_name=str(level),
+                level_no=resolved_emit,
+                message=message,
+                exception=exception,
+                extra=extra_kw,
+            )
+        elif type(message) is not str:
+            message = str(message)
 
         needs_caller, needs_thread, needs_process = self._compute_effective_requirements(
             resolved_emit
         )
-        inner = self._inner if extra_kw is None else self._inner.bind(extra_kw)
+        inner = self._current()[0]
+        if extra_kw is not None:
+            inner = inner.bind(extra_kw)
 
+        # Positional arguments follow the ``PyLogger.log`` signature (see _log_with_level).
         if needs_caller is False and needs_thread is False and needs_process is False:
-            if exception is None:
-                inner.log(level, str(message))
-            else:
-                inner.log(level, str(message), exception=exception)
+            inner.log(level, message, exception)
             return
 
         if needs_thread is False and needs_process is False:
@@ -987,83 +1154,74 @@ class Logger:
                     needs_caller.line,
                     needs_caller.file,
                 )
-            if exception is None:
-                inner.log(level, str(message), name=name, function=function, line=line, file=file)
-            else:
-                inner.log(
-                    level,
-                    str(message),
-                    exception=exception,
-                    name=name,
-                    function=function,
-                    line=line,
-                    file=file,
-                )
+            inner.log(level, message, exception, name, function, line, file)
             return
 
-        name_: str | None
-        function_: str | None
-        line_: int | None
-        file_: str | None
-        if needs_caller is True:
-            name_, function_, line_, file_ = _get_caller_info(_depth + 1)
-        elif needs_caller is not False:
-            name_, function_, line_, file_ = (
-                needs_caller.name,
-                needs_caller.function,
-                needs_caller.line,
-                needs_caller.file,
-            )
-        else:
-            name_, function_, line_, file_ = None, None, None, None
-
-        thread_name: str | None
-        thread_id: int | None
-        if needs_thread is True:
-            thread_name, thread_id = _get_thread_info()
-        elif needs_thread is not False:
-            thread_name = needs_thread.name
-            thread_id = needs_thread.id
-        else:
-            thread_name, thread_id = None, None
-
-        process_name: str | None
-        process_id: int | None
-        if needs_process is True:
-            process_name, process_id = _get_process_info()
-        elif needs_process is not False:
-            process_name = needs_process.name
-            process_id = needs_process.id
+        inner.log(
+            level,
+            message,
+            exception,
+            *_resolve_record_info(needs_caller, needs_thread, needs_process, _depth + 1),
+        )
+
+    def log_many(
+        self,
+        level: str | int,
+        messages: Iterable[Any],
+        *,
+        _depth: int = 0,
+    ) -> None:
+        """Log several messages at one level.
+
+        The level is resolved and checked once, and caller, thread, and process
+        information is collected once and shared by every record in the batch,
+        so this suits tight loops that emit many records from the same call
+        site. Messages are logged as-is (no kwargs formatting). When patchers
+        are registered, each message is logged through ``log()`` so patchers
+        still see every record.
+
+        Args:
+            level: Level name (str) or numeric value (int), built-in or custom.
+            messages: Messages to log, in order. Non-str values are coerced
+                via ``str()``.
+            _depth: Internal depth adjustment for wrapper methods.
+
+        Raises:
+            ValueError: If ``level`` is not a built-in or registered level.
+
+        Examples:
+            >>> logger.log_many("INFO", ["first", "second", "third"])
+            >>> logger.log_many(20, (f"row {i}" for i in range(1000)))
+        """
+        builtin = _builtin_level(level)
+        if builtin is not None:
+            level_no = builtin[0]
         else:
-            process_name, process_id = None, None
-
-        if exception is None:
-            inner.log(
-                level,
-                str(message),
-                name=name_,
-                function=function_,
-                line=line_,
-                file=file_,
-                thread_name=thread_name,
-                thread_id=thread_id,
-                process_name=process_name,
-                process_id=process_id,
-            )
+            resolved_emit = self._inner.try_resolve_emit_level_no(level)
+            if resolved_emit is None:
+                raise ValueError(f"Invalid log level: {level!r}")
+            level_no = resolved_emit
+
+        if level_no < self._min_level_box[0]:
+            return
+
+        if self._patchers:
+            for message in messages:
+                self.log(level, message, _depth=_depth + 1)
+            return
+
+        needs_caller, needs_thread, needs_process = self._compute_effective_requirements(level_no)
+        info = _resolve_record_info(needs_caller, needs_thread, needs_process, _depth + 1)
+
+        inner, inner_methods, _ = self._current()
+        if builtin is not None:
+            emit = inner_methods[builtin[1]]
+            for message in messages:
+                emit(message if type(message) is str else str(message), None, *info)
         else:
-            inner.log(
-                level,
-                str(message),
-                exception=exception,
-                name=name_,
-                function=function_,
-                line=line_,
-                file=file_,
-                thread_name=thread_name,
-                thread_id=thread_id,
-                process_name=process_name,
-                process_id=process_id,
-            )
+            log = inner.log
+            for message in messages:
+                log(level, message if type(message) is str else str(message), None, *info)
 
     def set_level(self, level: LogLevel | str) -> None:
         """Set minimum log level for console output."""
@@ -1083,7 +1241,18 @@ class Logger:
         Returns:
             True if at least one handler would process messages at this level.
         """
-        return self._inner.is_level_enabled(_to_log_level(level))
+        # Answered from the mirrored ``min_level`` box, the same check the core makes
+        if isinstance(level, str):
+            builtin = _LEVEL_DISPATCH.get(level)
+            if builtin is not None:
+                value = builtin[0]
+            else:
+                # Custom levels come from the core; unknown names still raise
+                level_no = self._inner.try_resolve_emit_level_no(level)
+                value = level_no if level_no is not None else _to_log_level(level).value
+        else:
+            value = level.value
+        return value >= self._min_level_box[0]
 
     def enable(self, level: LogLevel | str | None = None) -> None:
         """Enable console logging."""
@@ -1108,6 +1277,8 @@ class Logger:
             >>> logger.info("Final message")
             >>> logger.complete()  # Ensure message is written to files
         """
+        for queue in list(self._sink_queues.values()):
+            queue.flush()
         self._inner.complete()
 
     def add(
@@ -1144,7 +1315,9 @@ class Logger:
             enqueue: If True, writes are queued and processed asynchronously
                      in a background thread (thread-safe).
                      If False (default), writes are synchronous (reliable).
-                     Only valid for file sinks.
+                     For callable sinks, records are formatted and passed to the
+                     sink in batches on a worker thread; call complete() to wait
+                     for delivery. Ignored for console sinks.
             colorize: Enable ANSI color codes (for console sinks).
                       If None, auto-detect based on whether sink is a TTY.
                       Only valid for console sinks.
@@ -1168,7 +1341,23 @@ class Logger:
         Note:
             Callable sinks can be removed with remove() or remove_callback().
         """
-        import sys
+        # Fast path for the common ``logger.add("app.log")`` call with every option defaulted
+        if (
+            type(sink) is str
+            and level is None
+            and format is None
+            and rotation is None
+            and retention is None
+            and not compression
+            and not serialize
+            and filter is None
+            and not enqueue
+            and collect is None
+        ):
+            handler_id = self._inner.add(sink)
+            self._collect_options[handler_id] = CollectOptions()
+            self._invalidate_requirements_cache()
+            return handler_id
 
         # Check for callable sink first (before checking stdout/stderr)
         if callable(sink) and sink not in (sys.stdout, sys.stderr):
@@ -1178,14 +1367,14 @@ class Logger:
                 format=format,
                 serialize=serialize,
                 filter=filter,
+                enqueue=enqueue,
             )
             # For callable sinks, compute CollectOptions from format if not specified
             # This avoids relying on Rust's needs_* which is polluted by callback registration
             if collect is not None:
                 resolved_collect = collect
             else:
-                default_format = "{time} | {level:<8} | {name}:{function}:{line} - {message}"
-                resolved_collect = _collect_options_from_format(format or default_format)
+                resolved_collect = _collect_options_from_format(format or _DEFAULT_CALLABLE_FORMAT)
             self._collect_options[handler_id] = resolved_collect
             # Track as callback for proper removal via remove()
             self._callback_ids.add(handler_id)
@@ -1253,6 +1442,7 @@ class Logger:
         format: str | None = None,
         serialize: bool = False,
         filter: Callable[[dict[str, Any]], bool] | None = None,
+        enqueue: bool = False,
     ) -> int:
         """Add a callable as a sink (internal method).
 
@@ -1265,68 +1455,64 @@ class Logger:
             serialize: Output as JSON instead of text format.
             filter: Optional callable that receives a record dict and returns
                     True if the record should be logged, False to skip.
+            enqueue: Format and deliver records on a background thread.
 
         Returns:
             Handler ID for later removal.
         """
-        import json
-
         resolved_level = _to_log_level(level) if level is not None else None
-        default_format = "{time} | {level:<8} | {name}:{function}:{line} - {message}"
-        template_str = format or default_format
+        template_str = format or _DEFAULT_CALLABLE_FORMAT
 
         # Pre-parse template for efficient single-pass formatting
-        parsed_template = ParsedCallableTemplate(template_str)
+        parsed_template = get_template(template_str)
 
-        def callback_wrapper(record: dict[str, Any]) -> None:
-            # Apply filter if provided
-            if filter is not None and not filter(record):
-                return
+        # Pick the renderer once per sink instead of branching per record
+        render: Callable[[dict[str, Any]], str]
+        if serialize:
+            render = _serialize_callable_record
+        else:
+            render = parsed_template.format
+
+        if filter is None:
+
+            def callback_wrapper(record: dict[str, Any]) -> None:
+                try:
+                    sink(render(record))
+                except Exception:
+                    # Silently ignore sink errors (like loguru behavior)
+                    pass
+
+        else:
+
+            def callback_wrapper(record: dict[str, Any]) -> None:
+                if not filter(record):
+                    return
+                try:
+                    sink(render(record))
+                except Exception:
+                    # Silently ignore sink errors (like loguru behavior)
+                    pass
 
-            try:
-                if serialize:
-                    # Output as JSON matching Rust's format_record_json
-                    json_record: dict[str, Any] = {
-                        "time": record.get("timestamp", ""),
-                        "level": record.get("level", ""),
-                        "message": record.get("message", ""),
-                    }
-                    # Only include non-empty caller info
-                    if record.get("name"):
-                        json_record["name"] = record["name"]
-                    if record.get("function"):
-                        json_record["function"] = record["function"]
-                    if record.get("line"):
-                        json_record["line"] = record["line"]
-                    # Include extra if non-empty
-                    extra = record.get("extra", {})
-                    if extra:
-                        json_record["extra"] = extra
-                    # Include exception if present
-                    if record.get("exception"):
-                        json_record["exception"] = record["exception"]
-                    formatted = json.dumps(json_record)
-                else:
-                    # Format using pre-parsed template (single-pass, ~1-2us faster)
-                    formatted = parsed_template.format(record)
-
-                sink(formatted)
-            except Exception:
-                # Silently ignore sink errors (like loguru behavior)
-                pass
+        # With enqueue, Rust only appends the record; the worker runs the wrapper
+        queue = SinkQueue(callback_wrapper) if enqueue else None
+        callback = callback_wrapper if queue is None else queue.put
 
         # Lightweight path: Rust builds a minimal dict; filter/JSON need full dict.
         if filter is None and not serialize:
             flags = parsed_template.lightweight_requirements_for_rust()
             extra_keys = parsed_template.lightweight_extra_keys_for_rust()
-            return self._inner.add_formatted_sink_callback(
-                callback_wrapper, flags, extra_keys, resolved_level
+            handler_id = self._inner.add_formatted_sink_callback(
+                callback, flags, extra_keys, resolved_level
             )
         # Filter callbacks always observe the loguru-compatible text view of
         # extras; only filterless serialized sinks get the typed JSON dict.
-        if serialize and filter is None:
-            return self._inner.add_serialized_callback(callback_wrapper, resolved_level)
-        return self._inner.add_callback(callback_wrapper, resolved_level)
+        elif serialize and filter is None:
+            handler_id = self._inner.add_serialized_callback(callback, resolved_level)
+        else:
+            handler_id = self._inner.add_callback(callback, resolved_level)
+        if queue is not None:
+            self._sink_queues[handler_id] = queue
+        return handler_id
 
     def remove(self, handler_id: int | None = None) -> bool:
         """Remove a handler by ID, or all handlers if None.
@@ -1359,6 +1545,9 @@ class Logger:
             callbacks_removed = (
                 self._inner.remove_callbacks(all_callback_ids) if all_callback_ids else 0
             )
+            for queue in self._sink_queues.values():
+                queue.close()
+            self._sink_queues.clear()
             self._collect_options.clear()
             self._callback_ids.clear()
             self._filter_ids.clear()
@@ -1382,11 +1571,12 @@ class Logger:
             >>> user_logger.info("User action")
             # Output includes extra context in JSON mode
         """
-        new_inner = self._inner.bind(kwargs)
-        new_context = {**self._context, **kwargs}
+        inner, _, context = self._current()
+        new_inner = inner.bind(kwargs)
+        new_context = {**context, **kwargs}
         return Logger(
             new_inner,
-            patchers=self._patchers.copy(),
+            patchers=self._patchers,
             context=new_context,
             collect_options=self._collect_options,
             callback_ids=self._callback_ids,
@@ -1394,12 +1584,17 @@ class Logger:
             raw_callback_ids=self._raw_callback_ids,
             requirements_cache_box=self._requirements_cache_box,
             aggregated_options_box=self._aggregated_options_box,
+            min_level_box=self._min_level_box,
+            sink_queues=self._sink_queues,
         )
 
     @contextmanager
     def contextualize(self, **kwargs: Any) -> Generator[Logger, None, None]:
         """Temporarily bind context values within a with block.
 
+        The values are held in a context variable, so they only apply to the
+        current thread or asyncio task and never leak into concurrent ones.
+
         Args:
             **kwargs: Key-value pairs to bind temporarily.
 
@@ -1411,16 +1606,14 @@ class Logger:
             ...     logger.info("Processing")  # includes request_id
             >>> logger.info("Done")  # no request_id
         """
-        bound = self.bind(**kwargs)
-        original = self._inner
-        original_context = self._context
-        self._inner = bound._inner
-        self._context = bound._context
+        inner, _, context = self._current()
+        bound_inner = inner.bind(kwargs)
+        state = (bound_inner, _LazyLevelMethods(bound_inner), {**context, **kwargs})
+        token = _CONTEXTUALIZED.set({**(_CONTEXTUALIZED.get() or {}), self: state})
         try:
             yield self
         finally:
-            self._inner = original
-            self._context = original_context
+            _CONTEXTUALIZED.reset(token)
 
     def catch(
         self,
@@ -1453,14 +1646,33 @@ class Logger:
             >>> another_function()  # Logs and re-raises
         """
 
+        # Resolve the log method once per catch() call; every function decorated with the
+        # result shares it. Custom level names go through ``log()`` with the same depth.
+        builtin = _builtin_level(level)
+        builtin_no = builtin[0] if builtin is not None else None
+        log_method: Callable[..., None] = (
+            getattr(self, builtin[1]) if builtin is not None else functools.partial(self.log, level)
+        )
+
         def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
             @functools.wraps(func)
             def wrapper(*args: Any, **func_kwargs: Any) -> Any:
                 try:
                     return func(*args, **func_kwargs)
                 except exception as e:
+                    # Only stringify the traceback if some handler accepts the level
+                    level_no = (
+                        builtin_no
+                        if builtin_no is not None
+                        else self._inner.try_resolve_emit_level_no(level)
+                    )
+                    if level_no is not None and level_no < self._min_level_box[0]:
+                        if reraise:
+                            raise
+                        return None
+                    import traceback
+
                     tb = traceback.format_exc()
-                    log_method = getattr(self, level.lower())
                     # _depth=1 to skip this wrapper and show caller of decorated function
                     log_method(f"{message}: {e}", exception=tb, _depth=1)
                     if reraise:
@@ -1508,6 +1720,9 @@ class Logger:
             True if callback was removed, False otherwise.
         """
         result = self._inner.remove_callback(callback_id)
+        queue = self._sink_queues.pop(callback_id, None)
+        if queue is not None:
+            queue.close()
         # Clean up CollectOptions and tracking sets
         self._collect_options.pop(callback_id, None)
         self._callback_ids.discard(callback_id)
@@ -1540,18 +1755,20 @@ class Logger:
             >>> # Chain multiple patchers
             >>> logger.patch(add_user_id).patch(add_request_id).info("Log")
         """
-        new_patchers = self._patchers.copy()
-        new_patchers.append(patcher)
+        new_patchers = (*self._patchers, patcher)
+        inner, _, context = self._current()
         return Logger(
-            self._inner,
+            inner,
             patchers=new_patchers,
-            context=self._context,
+            context=context,
             collect_options=self._collect_options,
             callback_ids=self._callback_ids,
             filter_ids=self._filter_ids,
             raw_callback_ids=self._raw_callback_ids,
             requirements_cache_box=self._requirements_cache_box,
             aggregated_options_box=self._aggregated_options_box,
+            min_level_box=self._min_level_box,
+            sink_queues=self._sink_queues,
         )
 
     def configure(
@@ -1574,7 +1791,7 @@ class Logger:
                 - compression: Enable compression (file sinks only)
                 - serialize: Output as JSON
                 - filter: Filter function
-                - enqueue: Async writes (file sinks only, default False)
+                - enqueue: Async writes (file and callable sinks, default False)
                 - colorize: Enable ANSI colors (console sinks only)
             levels: List of custom level configurations. Each dict must have:
                 - name (required): Level name
@@ -1634,10 +1851,11 @@ class Logger:
         if extra:
             new_inner = self._inner.bind(extra)
             self._inner = new_inner
+            self._inner_methods = _LazyLevelMethods(new_inner)
             self._context.update(extra)
 
         if patcher:
-            self._patchers.append(patcher)
+            self._patchers = (*self._patchers, patcher)
 
         return handler_ids
 
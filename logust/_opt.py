@@ -3,14 +3,22 @@
 from __future__ import annotations
 
 import sys
-import traceback
 from typing import TYPE_CHECKING, Any
 
-from ._traceback import format_enhanced_traceback
+from ._traceback import format_enhanced_traceback, format_plain_traceback
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from ._logger import Logger
 
+if sys.version_info >= (3, 11):
+    _current_exception = sys.exception
+else:  # pragma: no cover - Python 3.10
+
+    def _current_exception() -> BaseException | None:
+        return sys.exc_info()[1]
+
 
 class OptLogger:
     """Wrapper logger with per-message options.
@@ -19,6 +27,9 @@ class OptLogger:
     but with additional behavior based on the options passed to opt().
     """
 
+    # One instance is created per ``opt()`` call, usually for a single message.
+    __slots__ = ("_backtrace", "_depth", "_diagnose", "_exception", "_lazy", "_logger")
+
     def __init__(
         self,
         logger: Logger,
@@ -41,66 +52,85 @@ class OptLogger:
         if not args:
             return message
 
-        if self._lazy:
-            evaluated_args = tuple(arg() if callable(arg) else arg for arg in args)
-            return message.format(*evaluated_args)
-        return message.format(*args)
+        if not self._lazy:
+            return message.format(*args)
+        # One or two arguments are the common case; pass them without a temporary tuple
+        if len(args) == 1:
+            (arg,) = args
+            return message.format(arg() if callable(arg) else arg)
+        if len(args) == 2:
+            first, second = args
+            return message.format(
+                first() if callable(first) else first,
+                second() if callable(second) else second,
+            )
+        return message.format(*[arg() if callable(arg) else arg for arg in args])
 
     def _get_exception(self) -> str | None:
         """Get exception traceback with optional enhancements."""
         if self._exception or self._backtrace or self._diagnose:
-            if sys.exc_info()[0] is not None:
+            if _current_exception() is not None:
                 if self._backtrace or self._diagnose:
                     return format_enhanced_traceback(
                         backtrace=self._backtrace,
                         diagnose=self._diagnose,
                     )
-                return traceback.format_exc()
+                return format_plain_traceback()
         return None
 
-    def _log(self, level: str, message: str, *args: Any, **kwargs: Any) -> None:
-        """Internal log method with option processing."""
+    def _log(
+        self,
+        level: str,
+        log_method: Callable[..., None],
+        message: str,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """Internal log method with option processing.
+
+        ``log_method`` is the matching bound method of the wrapped logger, looked
+        up by the caller with a plain attribute access instead of ``getattr``.
+        """
         # For lazy evaluation, skip formatting if level is not enabled
         if self._lazy and not self._logger.is_level_enabled(level):
             return
 
         formatted = self._format_message(message, *args)
         exc = kwargs.pop("exception", None) or self._get_exception()
-        log_method = getattr(self._logger, level)
         # Add depth: +1 for this method, +1 for the caller (trace/debug/etc), + user's depth
         log_method(formatted, exception=exc, _depth=self._depth + 2, **kwargs)
 
     def trace(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Output TRACE level log message with options."""
-        self._log("trace", message, *args, **kwargs)
+        self._log("trace", self._logger.trace, message, *args, **kwargs)
 
     def debug(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Output DEBUG level log message with options."""
-        self._log("debug", message, *args, **kwargs)
+        self._log("debug", self._logger.debug, message, *args, **kwargs)
 
     def info(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Output INFO level log message with options."""
-        self._log("info", message, *args, **kwargs)
+        self._log("info", self._logger.info, message, *args, **kwargs)
 
     def success(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Output SUCCESS level log message with options."""
-        self._log("success", message, *args, **kwargs)
+        self._log("success", self._logger.success, message, *args, **kwargs)
 
     def warning(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Output WARNING level log message with options."""
-        self._log("warning", message, *args, **kwargs)
+        self._log("warning", self._logger.warning, message, *args, **kwargs)
 
     def error(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Output ERROR level log message with options."""
-        self._log("error", message, *args, **kwargs)
+        self._log("error", self._logger.error, message, *args, **kwargs)
 
     def fail(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Output FAIL level log message with options."""
-        self._log("fail", message, *args, **kwargs)
+        self._log("fail", self._logger.fail, message, *args, **kwargs)
 
     def critical(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Output CRITICAL level log message with options."""
-        self._log("critical", message, *args, **kwargs)
+        self._log("critical", self._logger.critical, message, *args, **kwargs)
 
     def log(self, level: str | int, message: str, *args: Any, **kwargs: Any) -> None:
         """Output log message at any level (built-in or custom) with options.
@@ -0,0 +1,41 @@
+"""Optional accelerators (``re2``, ``orjson``) shared by parsing and contrib code."""
+
+from __future__ import annotations
+
+import functools
+import json
+import re
+from typing import Any
+
+
+@functools.cache
+def optional_module(name: str) -> Any:
+    """Import an optional accelerator (``re2``, ``orjson``) on first use, or ``None``.
+
+    Deferred so that ``import logust`` does not pay for them unless they are used.
+    """
+    import importlib
+
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+# 19+ digit runs may be integers outside i64/u64, which orjson turns into floats
+_LONG_DIGITS = re.compile(r"[0-9]{19}")
+
+
+def json_loads(text: str) -> Any:
+    """Decode JSON with orjson when installed, else ``json``.
+
+    orjson rejects ``NaN``/``Infinity`` and loses precision on integers beyond
+    64 bits; such input goes through ``json.loads`` so results match the stdlib.
+    """
+    orjson = optional_module("orjson")
+    if orjson is not None and _LONG_DIGITS.search(text) is None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
@@ -2,10 +2,329 @@
 
 from __future__ import annotations
 
+import functools
+import io
+import itertools
+import json
 import re
-from collections.abc import Iterator
+import sys
+from collections.abc import Iterable, Iterator
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
+
+from ._optional import json_loads, optional_module
+
+# ``re._parser`` on 3.11+, ``sre_parse`` before it (importing it there is deprecated)
+_sre_parse: Any = getattr(re, "_parser", None)
+if _sre_parse is None:  # pragma: no cover - Python 3.10
+    import sre_parse as _sre_parse
+
+# Files smaller than this are always parsed in-process; pool start-up would dominate.
+_PARALLEL_MIN_BYTES = 1 << 20
+
+# Byte ranges per worker, so one slow range does not leave the other workers idle
+_RANGES_PER_WORKER = 4
+
+# Bytes read per step of the literal-prefix scan
+_SCAN_BLOCK_SIZE = 1 << 18
+
+
+def _uses_unicode_classes(items: Any) -> bool:
+    """Whether parsed ``items`` use ``\\w``/``\\d``/``\\s``-style classes or ``\\b``/``\\B``.
+
+    These are Unicode-aware in ``re`` but ASCII-only in RE2.
+    """
+    for op, av in items:
+        if op == _sre_parse.CATEGORY:
+            return True
+        if op == _sre_parse.IN:
+            if any(item_op == _sre_parse.CATEGORY for item_op, _ in av):
+                return True
+            continue
+        if op == _sre_parse.AT:
+            if av in (_sre_parse.AT_BOUNDARY, _sre_parse.AT_NON_BOUNDARY):
+                return True
+            continue
+        # Groups, repeats, branches and conditionals nest further subpatterns
+        stack = [av]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, _sre_parse.SubPattern):
+                if _uses_unicode_classes(node):
+                    return True
+            elif isinstance(node, (tuple, list)):
+                stack.extend(node)
+    return False
+
+
+def _re2_compatible(pattern: str) -> bool:
+    """Whether RE2 would match ``pattern`` exactly like ``re`` does on ``str`` input."""
+    try:
+        parsed = _sre_parse.parse(pattern)
+    except Exception:
+        return False
+    return bool(parsed.state.flags & re.ASCII) or not _uses_unicode_classes(parsed)
+
+
+def _compile_regex(pattern: str) -> Any:
+    """Compile with RE2 (linear-time matching) when installed and equivalent, else ``re``.
+
+    RE2 rejects backreferences and lookarounds, and its ``\\w``, ``\\d``, ``\\s``
+    and ``\\b`` only cover ASCII; such patterns are compiled with ``re`` so that
+    results do not depend on whether RE2 is installed.
+    """
+    re2 = optional_module("re2")
+    if re2 is not None and _re2_compatible(pattern):
+        try:
+            return re2.compile(pattern)
+        except re2.error:
+            pass
+    return re.compile(pattern)
+
+
+def _collect_literal_prefix(items: Any, chars: list[str]) -> bool:
+    """Append the leading literal characters of parsed ``items``; True if all were literal."""
+    for op, av in items:
+        if op == _sre_parse.LITERAL:
+            chars.append(chr(av))
+        elif op == _sre_parse.AT and av in (
+            _sre_parse.AT_BEGINNING,
+            _sre_parse.AT_BEGINNING_STRING,
+        ):
+            continue
+        elif op == _sre_parse.SUBPATTERN:
+            _group, add_flags, del_flags, sub = av
+            if add_flags or del_flags or not _collect_literal_prefix(sub, chars):
+                return False
+        else:
+            return False
+    return True
+
+
+def _prefilter(pattern: str) -> tuple[str, int]:
+    """Return ``(literal_prefix, min_length)`` every line matching ``pattern`` must have.
+
+    Lets ``parse()`` reject lines with ``str.startswith`` / ``len`` before the
+    regex engine runs. Case-insensitive patterns only get the length bound.
+    """
+    try:
+        parsed = _sre_parse.parse(pattern)
+    except Exception:
+        return "", 0
+    min_length = min(parsed.getwidth()[0], sys.maxsize)
+    if parsed.state.flags & re.IGNORECASE:
+        return "", min_length
+    chars: list[str] = []
+    _collect_literal_prefix(parsed, chars)
+    return "".join(chars), min_length
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(pattern: str) -> tuple[Any, str, int]:
+    """Compile ``pattern`` and derive its prefilter once; shared by repeated parse() calls.
+
+    Returns:
+        ``(compiled, literal_prefix, min_length)``.
+    """
+    return (_compile_regex(pattern), *_prefilter(pattern))
+
+
+def _apply_cast(record: dict[str, Any], cast: dict[str, type]) -> None:
+    """Convert matched groups in place; values that fail to convert are kept as str."""
+    for key, type_func in cast.items():
+        if key in record and record[key] is not None:
+            try:
+                record[key] = type_func(record[key])
+            except (ValueError, TypeError):
+                pass
+
+
+def _iter_matches(
+    lines: Iterable[tuple[str, int]], compiled: Any, cast: dict[str, type]
+) -> Iterator[dict[str, Any]]:
+    """Match ``(text, end)`` candidate lines, yielding the (cast) named groups of each hit.
+
+    Shared by the sequential, memory-mapped and worker paths of ``parse()``.
+    """
+    match_line = compiled.match
+    for line, end in lines:
+        match = match_line(line, 0, end)
+        if match:
+            record = match.groupdict()
+            if cast:
+                _apply_cast(record, cast)
+            yield record
+
+
+def _prefix_bytes(prefix: str) -> bytes | None:
+    """UTF-8 form of ``prefix`` for byte-level scans, or ``None`` if bytes cannot decide.
+
+    U+FFFD can stand for undecodable bytes, and a lone surrogate has no UTF-8
+    form at all; such prefixes are only checked after decoding.
+    """
+    if "\ufffd" in prefix:
+        return None
+    try:
+        return prefix.encode()
+    except UnicodeEncodeError:
+        return None
+
+
+def _span_lines(data: bytes, prefix: bytes, min_length: int) -> Iterator[tuple[str, int]]:
+    """Decode the lines found by :func:`_prefixed_line_spans` that are long enough."""
+    for start, end in _prefixed_line_spans(data, prefix):
+        if end - start < min_length:
+            continue
+        line = data[start:end].decode("utf-8", errors="replace")
+        yield line, len(line)
+
+
+def _candidate_lines(
+    raw_lines: Iterable[bytes], prefix: str, min_length: int
+) -> Iterator[tuple[str, int]]:
+    """Decode the lines of a binary file that can pass the prefilter.
+
+    Lines are rejected on their raw bytes, so the common mismatch is never
+    decoded. Splitting matches text mode: a lone ``"\\r"`` also ends a line.
+
+    Yields:
+        ``(text, end)`` where ``text[:end]`` is the line without its line break;
+        pass ``end`` as ``endpos`` to ``match`` instead of slicing off the break.
+    """
+    prefix_bytes = _prefix_bytes(prefix) or b""
+    for raw in raw_lines:
+        # UTF-8 never has fewer bytes than characters, so short lines cannot match
+        if len(raw) < min_length:
+            continue
+        if not raw.startswith(prefix_bytes) and b"\r" not in raw.rstrip(b"\r\n"):
+            continue
+        text = raw.decode("utf-8", errors="replace")
+        if "\r" not in text:
+            end = len(text) - 1 if text.endswith("\n") else len(text)
+            if end >= min_length and text.startswith(prefix, 0, end):
+                yield text, end
+            continue
+        pieces = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+        if pieces[-1] == "":
+            pieces.pop()
+        for line in pieces:
+            if len(line) >= min_length and line.startswith(prefix):
+                yield line, len(line)
+
+
+def _scan_lines(f: BinaryIO, prefix: bytes, min_length: int) -> Iterator[tuple[str, int]]:
+    """Candidate lines of ``f`` found by :func:`_prefixed_line_spans`, block by block.
+
+    The file is read in blocks cut after their last ``"\\n"``, so every scanned
+    line (and every ``"\\n" + prefix`` needle) is whole and lines are decoded in
+    one piece. Plain reads, unlike a memory map, stay safe when a live log is
+    truncated under the scan. Once a ``"\\r"`` shows up (it would also end
+    lines in text mode), the rest of the file goes through :func:`_candidate_lines`.
+    """
+    # Start of a line that continues into the next block; grown in place so a
+    # very long line costs linear, not quadratic, copying
+    pending = bytearray()
+    while True:
+        block = f.read(_SCAN_BLOCK_SIZE)
+        if not block:
+            break
+        if b"\r" in block:
+            # Finish the current line so the line-by-line path starts on a boundary
+            data = bytes(pending) + block + f.readline()
+            raw_lines = itertools.chain(io.BytesIO(data), f)
+            yield from _candidate_lines(raw_lines, prefix.decode(), min_length)
+            return
+        cut = block.rfind(b"\n") + 1
+        if not cut:
+            pending += block
+            continue
+        data = bytes(pending) + block[:cut]
+        pending = bytearray(block[cut:])
+        yield from _span_lines(data, prefix, min_length)
+    if pending:
+        # Unterminated last line
+        yield from _span_lines(bytes(pending), prefix, min_length)
+
+
+def _prefixed_line_spans(data: bytes, prefix: bytes) -> Iterator[tuple[int, int]]:
+    """Yield ``(start, end)`` of the ``"\\n"``-terminated lines starting with ``prefix``.
+
+    ``end`` excludes the line break. Jumps between ``"\\n" + prefix`` hits with
+    ``find`` (memchr speed in C), so lines that cannot match cost no Python work.
+    """
+    needle = b"\n" + prefix
+    size = len(data)
+    if data[: len(prefix)] == prefix:
+        start = 0
+    else:
+        hit = data.find(needle)
+        start = -1 if hit == -1 else hit + 1
+    while start != -1:
+        end = data.find(b"\n", start)
+        if end == -1:
+            yield start, size
+            return
+        yield start, end
+        hit = data.find(needle, end)
+        start = -1 if hit == -1 else hit + 1
+
+
+def _line_ranges(path: Path, parts: int) -> list[tuple[int, int]]:
+    """Split a file into about ``parts`` byte ranges that each end on a line break."""
+    with path.open("rb") as f:
+        size = f.seek(0, 2)
+        ranges: list[tuple[int, int]] = []
+        start = 0
+        for i in range(1, parts):
+            # Cut after the first line break at or past the even split point
+            f.seek(max(start, size * i // parts))
+            f.readline()
+            end = f.tell()
+            if end >= size:
+                break
+            ranges.append((start, end))
+            start = end
+        if start < size:
+            ranges.append((start, size))
+        return ranges
+
+
+def _parse_range(
+    path: str, start: int, end: int, pattern: str, cast: dict[str, type]
+) -> list[dict[str, Any]]:
+    """Worker: match every line in ``[start, end)`` of ``path`` against ``pattern``."""
+    compiled, prefix, min_length = _compile(pattern)
+    with open(path, "rb") as f:
+        f.seek(start)
+        raw = f.read(end - start)
+    prefix_bytes = _prefix_bytes(prefix)
+    if prefix_bytes and b"\r" not in raw:
+        return list(_iter_matches(_span_lines(raw, prefix_bytes, min_length), compiled, cast))
+    text = raw.decode("utf-8", errors="replace")
+    # Same line splitting as text-mode iteration: "\r\n", "\r" and "\n" all end a line
+    lines = text.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    if lines[-1] == "":
+        lines.pop()
+    candidates = (
+        (line, len(line)) for line in lines if len(line) >= min_length and line.startswith(prefix)
+    )
+    return list(_iter_matches(candidates, compiled, cast))
+
+
+def _parse_parallel(
+    file_path: Path, pattern: str, cast: dict[str, type], workers: int
+) -> Iterator[dict[str, Any]]:
+    """Parse line-aligned byte ranges in worker processes, yielding in file order."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    ranges = _line_ranges(file_path, workers * _RANGES_PER_WORKER)
+    path = str(file_path)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_parse_range, path, start, end, pattern, cast) for start, end in ranges
+        ]
+        for future in futures:
+            yield from future.result()
 
 
 def parse(
@@ -14,17 +333,24 @@ def parse(
     *,
     cast: dict[str, type] | None = None,
     chunk_size: int = 8192,
+    workers: int | None = None,
 ) -> Iterator[dict[str, Any]]:
     """Parse a log file and extract structured data.
 
     Uses regex named groups to extract fields from each log line.
-    Lines that don't match the pattern are skipped.
+    Lines that don't match the pattern are skipped. If ``google-re2`` is
+    installed (``pip install logust[re2]``) it is used for linear-time
+    matching; patterns RE2 cannot compile fall back to :mod:`re`.
 
     Args:
         file: Path to the log file.
         pattern: Regex pattern with named groups (e.g., "(?P<level>\\S+)").
         cast: Optional dict mapping group names to types for conversion.
         chunk_size: Read buffer size in bytes.
+        workers: Number of worker processes. When greater than 1 and the file is
+            at least 1 MiB, line-aligned byte ranges are matched in parallel and
+            records are still yielded in file order. ``pattern`` and ``cast``
+            must be picklable (builtin types such as ``int`` are).
 
     Yields:
         Dict containing the matched groups for each line.
@@ -40,6 +366,10 @@ def parse(
         >>> for record in parse("app.log", pattern, cast={"count": int}):
         ...     print(record["count"] + 1)  # count is now an int
 
+        >>> # Large file, matched on 8 processes
+        >>> for record in parse("huge.log", pattern, workers=8):
+        ...     print(record["level"])
+
         >>> # Parse JSON logs
         >>> import json
         >>> for line in open("app.json"):
@@ -52,23 +382,21 @@ def parse(
         ...     if record["level"] == "ERROR":
         ...         print(record["message"])
     """
-    compiled = re.compile(pattern)
+    compiled, prefix, min_length = _compile(pattern)
     cast = cast or {}
     file_path = Path(file)
 
-    with file_path.open("r", encoding="utf-8", errors="replace") as f:
-        for line in f:
-            line = line.rstrip("\n\r")
-            match = compiled.match(line)
-            if match:
-                record = match.groupdict()
-                for key, type_func in cast.items():
-                    if key in record and record[key] is not None:
-                        try:
-                            record[key] = type_func(record[key])
-                        except (ValueError, TypeError):
-                            pass
-                yield record
+    if workers is not None and workers > 1 and file_path.stat().st_size >= _PARALLEL_MIN_BYTES:
+        yield from _parse_parallel(file_path, pattern, cast, workers)
+        return
+
+    prefix_bytes = _prefix_bytes(prefix)
+    with file_path.open("rb") as f:
+        if prefix_bytes:
+            lines = _scan_lines(f, prefix_bytes, min_length)
+        else:
+            lines = _candidate_lines(f, prefix, min_length)
+        yield from _iter_matches(lines, compiled, cast)
 
 
 def parse_json(
@@ -78,7 +406,8 @@ def parse_json(
 ) -> Iterator[dict[str, Any]]:
     """Parse a JSON-lines log file.
 
-    Each line is expected to be a valid JSON object.
+    Each line is expected to be a valid JSON object. If ``orjson`` is installed
+    (``pip install logust[orjson]``) it is used to decode lines.
 
     Args:
         file: Path to the log file.
@@ -95,8 +424,6 @@ def parse_json(
         >>> # Filter by level
         >>> errors = [r for r in parse_json("app.json") if r.get("level") == "ERROR"]
     """
-    import json
-
     file_path = Path(file)
 
     with file_path.open("r", encoding="utf-8", errors="replace") as f:
@@ -105,7 +432,7 @@ def parse_json(
             if not line:
                 continue
             try:
-                yield json.loads(line)
+                yield json_loads(line)
             except json.JSONDecodeError as e:
                 if strict:
                     raise ValueError(f"Invalid JSON at line {line_num}: {e}") from e
@@ -0,0 +1,132 @@
+"""Background delivery for callable sinks added with ``enqueue=True``.
+
+The Rust callback only puts the record on a ``SimpleQueue``; a worker thread
+started on first use formats the queued records and calls the sink, so a
+slow sink (network, database, ...) no longer blocks the logging thread.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import threading
+import weakref
+from collections.abc import Callable
+from queue import Empty, SimpleQueue
+from typing import Any
+
+# Maximum records handed to the sink per wake-up of the worker thread
+BATCH_SIZE = 128
+
+# Live queues, flushed at interpreter exit and reset in forked children
+_QUEUES: weakref.WeakSet[SinkQueue] = weakref.WeakSet()
+
+# Queued after the last record by close(); tells the worker to exit
+_STOP = object()
+
+
+class SinkQueue:
+    """SimpleQueue-backed queue draining records into a handler on a worker thread.
+
+    ``put`` never takes a Python-level lock: ``SimpleQueue.put`` is atomic, and
+    flush/close requests travel through the same queue as markers, so they are
+    handled in order after every record queued before them.
+    """
+
+    __slots__ = (
+        "__weakref__",
+        "_closed",
+        "_handler",
+        "_items",
+        "_lock",
+        "_thread",
+    )
+
+    def __init__(self, handler: Callable[[dict[str, Any]], None]) -> None:
+        self._handler = handler
+        self._items: SimpleQueue[Any] = SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+        # Guards worker start-up and orders flush/close markers against each other
+        self._lock = threading.Lock()
+        _QUEUES.add(self)
+
+    def put(self, record: dict[str, Any]) -> None:
+        """Queue a record for delivery; called from the Rust callback."""
+        if self._thread is None:
+            self._start()
+        if not self._closed:
+            self._items.put(record)
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None and not self._closed:
+                thread = threading.Thread(target=self._run, name="logust-sink-queue", daemon=True)
+                thread.start()
+                self._thread = thread
+
+    def flush(self) -> None:
+        """Block until every queued record has been delivered."""
+        with self._lock:
+            thread = self._thread
+            if thread is None or thread is threading.current_thread() or self._closed:
+                return
+            done = threading.Event()
+            self._items.put(done)
+        done.wait()
+
+    def close(self) -> None:
+        """Deliver the remaining records, then stop the worker thread."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            thread = self._thread
+            self._items.put(_STOP)
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+        _QUEUES.discard(self)
+
+    def _run(self) -> None:
+        get = self._items.get
+        get_nowait = self._items.get_nowait
+        handler = self._handler
+        while True:
+            batch = [get()]
+            try:
+                while len(batch) < BATCH_SIZE:
+                    batch.append(get_nowait())
+            except Empty:
+                pass
+            for item in batch:
+                if item is _STOP:
+                    return
+                if item.__class__ is threading.Event:
+                    item.set()
+                    continue
+                try:
+                    handler(item)
+                except Exception:
+                    # A failing filter must not kill the worker and stall flush()
+                    pass
+
+    def _after_fork_in_child(self) -> None:
+        # The worker thread does not survive fork(); drop inherited records and locks
+        self._items = SimpleQueue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+
+def _flush_all() -> None:
+    for queue in list(_QUEUES):
+        queue.flush()
+
+
+def _after_fork_in_child() -> None:
+    for queue in list(_QUEUES):
+        queue._after_fork_in_child()
+
+
+atexit.register(_flush_all)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
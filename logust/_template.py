@@ -7,8 +7,9 @@ at sink creation time.
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from collections.abc import Callable
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
 
 if TYPE_CHECKING:
     pass
@@ -32,16 +33,28 @@ KNOWN_TOKENS: tuple[str, ...] = (
 # Tokens that require caller info collection
 CALLER_TOKENS: frozenset[str] = frozenset({"name", "module", "function", "line", "file"})
 
-
-@dataclass(frozen=True, slots=True)
-class LiteralSegment:
+# Token -> (record key, default) for tokens read straight from the record.
+# ``thread`` / ``process`` are composed from two fields and handled separately.
+_RECORD_FIELDS: dict[str, tuple[str, Any]] = {
+    "time": ("timestamp", ""),
+    "level": ("level", ""),
+    "name": ("name", ""),
+    "module": ("name", ""),
+    "function": ("function", ""),
+    "line": ("line", 0),
+    "file": ("file", ""),
+    "elapsed": ("elapsed", "00:00:00.000"),
+    "message": ("message", ""),
+}
+
+
+class LiteralSegment(NamedTuple):
     """A literal text segment in the template."""
 
     text: str
 
 
-@dataclass(frozen=True, slots=True)
-class TokenSegment:
+class TokenSegment(NamedTuple):
     """A token placeholder in the template."""
 
     key: str
@@ -54,6 +67,122 @@ class TokenSegment:
 Segment = LiteralSegment | TokenSegment
 
 
+def _format_spec(value: Any, spec: str) -> str:
+    """Apply a format spec, falling back to ``str()`` for values that reject it."""
+    try:
+        return format(value, spec)
+    except (ValueError, TypeError):
+        return str(value)
+
+
+def _value_source(seg: TokenSegment) -> str:
+    """Python expression reading a token's value inside the generated formatter."""
+    if seg.is_extra:
+        return f"extra.get({seg.extra_key!r}, '')"
+    field = _RECORD_FIELDS.get(seg.key)
+    if field is not None:
+        return f"record.get({field[0]!r}, {field[1]!r})"
+    if seg.key == "thread":
+        return "thread_str"
+    if seg.key == "process":
+        return "process_str"
+    return "''"
+
+
+# Characters that stop a spec from being inlined into the generated f-string
+_UNSAFE_SPEC_CHARS = frozenset("{}\\'\"\r\n")
+
+
+def _fstring_literal(text: str) -> str:
+    """Escape literal template text for the body of a double-quoted f-string."""
+    escaped = text.encode("unicode_escape").decode("ascii").replace('"', '\\"')
+    return escaped.replace("{", "{{").replace("}", "}}")
+
+
+def _compile_formatter(segments: tuple[Segment, ...]) -> Callable[[dict[str, Any]], str]:
+    """Generate a formatter specialized to ``segments``.
+
+    The segment walk, ``isinstance`` checks and field dispatch all happen here,
+    once per template; the generated function only reads the record and builds
+    the output with a single f-string. When a value rejects its spec, the
+    record is re-formatted through a ``join`` based twin that falls back to
+    ``str()`` for that token only.
+    """
+    keys = {seg.key for seg in segments if isinstance(seg, TokenSegment)}
+    if not keys:
+        # Empty or literal-only template: the output never depends on the record
+        text = "".join(cast("LiteralSegment", seg).text for seg in segments)
+
+        def _format_constant(record: dict[str, Any]) -> str:
+            return text
+
+        return _format_constant
+
+    prelude: list[str] = []
+    if "extra" in keys:
+        prelude.append("extra = record.get('extra', {})")
+        prelude.append("if not isinstance(extra, dict):")
+        prelude.append("    extra = {}")
+    if "thread" in keys:
+        prelude.append(
+            "thread_str = f\"{record.get('thread_name', '')}:{record.get('thread_id', 0)}\""
+        )
+    if "process" in keys:
+        prelude.append(
+            "process_str = f\"{record.get('process_name', '')}:{record.get('process_id', 0)}\""
+        )
+
+    # Slow path: one str()/_format_spec() call per token, joined at the end
+    parts: list[str] = []
+    for seg in segments:
+        if isinstance(seg, LiteralSegment):
+            parts.append(repr(seg.text))
+        elif seg.spec:
+            parts.append(f"_format_spec({_value_source(seg)}, {seg.spec!r})")
+        else:
+            parts.append(f"str({_value_source(seg)})")
+    slow_body = [*prelude, f"return ''.join(({''.join(part + ', ' for part in parts)}))"]
+
+    # Fast path: values are bound to locals first so that no quote or backslash
+    # from an extra key ends up inside an f-string replacement field
+    fast_body = list(prelude)
+    pieces: list[str] = []
+    has_spec = False
+    for index, seg in enumerate(segments):
+        if isinstance(seg, LiteralSegment):
+            pieces.append(_fstring_literal(seg.text))
+            continue
+        value = f"v{index}"
+        if seg.spec and _UNSAFE_SPEC_CHARS.isdisjoint(seg.spec):
+            has_spec = True
+            fast_body.append(f"{value} = {_value_source(seg)}")
+            pieces.append(f"{{{value}:{seg.spec}}}")
+        elif seg.spec:
+            fast_body.append(f"{value} = _format_spec({_value_source(seg)}, {seg.spec!r})")
+            pieces.append(f"{{{value}}}")
+        else:
+            fast_body.append(f"{value} = {_value_source(seg)}")
+            pieces.append(f"{{{value}!s}}")
+    result = f'f"{"".join(pieces)}"'
+    if has_spec:
+        fast_body += [
+            "try:",
+            f"    return {result}",
+            "except (ValueError, TypeError):",
+            "    return _format_slow(record)",
+        ]
+    else:
+        fast_body.append(f"return {result}")
+
+    source = "".join(
+        f"def {name}(record):\n" + "".join(f"    {line}\n" for line in body)
+        for name, body in (("_format_slow", slow_body), ("_format", fast_body))
+    )
+    namespace: dict[str, Any] = {"_format_spec": _format_spec}
+    exec(compile(source, "<logust template>", "exec"), namespace)
+    return cast("Callable[[dict[str, Any]], str]", namespace["_format"])
+
+
 class ParsedCallableTemplate:
     """Pre-parsed format template for callable sinks.
 
@@ -64,7 +193,15 @@ class ParsedCallableTemplate:
     Performance improvement: ~1-2us/log for callable sinks.
     """
 
-    __slots__ = ("_needed_tokens", "_needs_extra", "_needs_process", "_needs_thread", "_segments")
+    __slots__ = (
+        "_format_fn",
+        "_needed_tokens",
+        "_needs_extra",
+        "_needs_process",
+        "_needs_thread",
+        "_segments",
+        "_template",
+    )
 
     # Token pattern: {token} or {token:spec} or {extra[key]} or {extra[key]:spec}
     # Only matches known tokens to preserve unknown patterns as literals
@@ -80,6 +217,7 @@ class ParsedCallableTemplate:
         Args:
             template: Format template string.
         """
+        self._template = template
         self._segments: tuple[Segment, ...] = self._parse(template)
         # Pre-compute which tokens are needed for lazy evaluation
         self._needed_tokens: frozenset[str] = frozenset(
@@ -88,6 +226,15 @@ class ParsedCallableTemplate:
         self._needs_extra = "extra" in self._needed_tokens
         self._needs_thread = "thread" in self._needed_tokens
         self._needs_process = "process" in self._needed_tokens
+        self._format_fn = _compile_formatter(self._segments)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ParsedCallableTemplate):
+            return NotImplemented
+        return self._template == other._template
+
+    def __hash__(self) -> int:
+        return hash(self._template)
 
     def _parse(self, template: str) -> tuple[Segment, ...]:
         """Parse template into literal and token segments.
@@ -123,6 +270,11 @@ class ParsedCallableTemplate:
 
         return tuple(segments)
 
+    @property
+    def needed_tokens(self) -> frozenset[str]:
+        """Token keys used by the template (``extra[...]`` tokens count as ``extra``)."""
+        return self._needed_tokens
+
     def lightweight_requirements_for_rust(self) -> tuple[bool, ...]:
         """Booleans for Rust `FormattedSinkRequirements` / `build_mini_record_dict`.
 
@@ -161,7 +313,7 @@ class ParsedCallableTemplate:
     def format(self, record: dict[str, Any]) -> str:
         """Format the record using pre-parsed template.
 
-        Single-pass formatting using pre-parsed segments.
+        Runs the formatter generated for this template at parse time.
         Braces in message content are naturally preserved since
         we don't do any string replacement on the output.
 
@@ -171,66 +323,20 @@ class ParsedCallableTemplate:
         Returns:
             Formatted log message string.
         """
-        parts: list[str] = []
+        return self._format_fn(record)
 
-        # Only fetch extra if needed
-        if self._needs_extra:
-            extra = record.get("extra", {})
-            if not isinstance(extra, dict):
-                extra = {}
-        else:
-            extra = {}
 
-        # Pre-format thread/process only if needed (avoid string formatting overhead)
-        thread_str = (
-            f"{record.get('thread_name', '')}:{record.get('thread_id', 0)}"
-            if self._needs_thread
-            else ""
-        )
-        process_str = (
-            f"{record.get('process_name', '')}:{record.get('process_id', 0)}"
-            if self._needs_process
-            else ""
-        )
+@lru_cache(maxsize=128)
+def get_template(template: str) -> ParsedCallableTemplate:
+    """Return the parsed template for ``template``, parsing it only once.
 
-        for seg in self._segments:
-            if isinstance(seg, LiteralSegment):
-                parts.append(seg.text)
-            else:
-                # TokenSegment - get value lazily
-                if seg.is_extra:
-                    value = extra.get(seg.extra_key, "")
-                else:
-                    key = seg.key
-                    if key == "time":
-                        value = record.get("timestamp", "")
-                    elif key == "level":
-                        value = record.get("level", "")
-                    elif key == "name" or key == "module":
-                        value = record.get("name", "")
-                    elif key == "function":
-                        value = record.get("function", "")
-                    elif key == "line":
-                        value = record.get("line", 0)
-                    elif key == "file":
-                        value = record.get("file", "")
-                    elif key == "elapsed":
-                        value = record.get("elapsed", "00:00:00.000")
-                    elif key == "thread":
-                        value = thread_str
-                    elif key == "process":
-                        value = process_str
-                    elif key == "message":
-                        value = record.get("message", "")
-                    else:
-                        value = ""
-
-                if seg.spec:
-                    try:
-                        parts.append(format(value, seg.spec))
-                    except (ValueError, TypeError):
-                        parts.append(str(value))
-                else:
-                    parts.append(str(value))
-
-        return "".join(parts)
+    Sinks added with the same format share one instance (and one generated
+    formatter), which keeps repeated ``add()`` / ``configure()`` calls cheap.
+
+    Args:
+        template: Format template string.
+
+    Returns:
+        Cached ParsedCallableTemplate for the template.
+    """
+    return ParsedCallableTemplate(template)
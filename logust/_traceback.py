@@ -2,11 +2,27 @@
 
 from __future__ import annotations
 
+import io
 import linecache
+import re
 import sys
 from types import FrameType, TracebackType
 
 
+def format_plain_traceback() -> str:
+    """Format the current exception exactly like ``traceback.format_exc()``.
+
+    ``traceback`` is imported on first use; it is only needed on error paths.
+    """
+    import traceback
+
+    return traceback.format_exc()
+
+
+# Python identifiers (including non-ASCII ones) appearing in a source line
+_IDENTIFIER = re.compile(r"\b(?!\d)\w+")
+
+
 def format_enhanced_traceback(
     backtrace: bool = False,
     diagnose: bool = False,
@@ -18,13 +34,20 @@ def format_enhanced_traceback(
         diagnose: Show variable values at each frame.
 
     Returns:
-        Formatted traceback string.
+        Formatted traceback string. Without either option this is the plain
+        ``traceback.format_exc()`` output; no frames are walked.
     """
+    if not backtrace and not diagnose:
+        return format_plain_traceback()
+
     exc_info = sys.exc_info()
     if exc_info[0] is None:
         return ""
 
-    lines: list[str] = ["Traceback (most recent call last):"]
+    # Lines are written with a leading "\n", so the output has no trailing newline
+    buf = io.StringIO()
+    write = buf.write
+    write("Traceback (most recent call last):")
 
     tb: TracebackType | None = exc_info[2]
     frames: list[tuple[FrameType, int]] = []
@@ -51,32 +74,41 @@ def format_enhanced_traceback(
         if "logust" in filename:
             continue
 
-        lines.append(f'  File "{filename}", line {lineno}, in {funcname}')
+        write('\n  File "')
+        write(filename)
+        write('", line ')
+        write(str(lineno))
+        write(", in ")
+        write(funcname)
 
         try:
+            # Like ``traceback``, drop cached lines of files edited since they were read
+            linecache.checkcache(filename)
             source = linecache.getline(filename, lineno).strip()
             if source:
-                lines.append(f"    {source}")
+                write("\n    ")
+                write(source)
 
                 if diagnose:
-                    local_vars = frame.f_locals
-                    shown_vars: set[str] = set()
-                    for var_name, var_value in local_vars.items():
-                        if (
-                            var_name in source
-                            and not var_name.startswith("_")
-                            and var_name not in shown_vars
-                        ):
-                            shown_vars.add(var_name)
+                    # Whole-identifier matches: ``a`` is not shown for ``data``
+                    identifiers = set(_IDENTIFIER.findall(source))
+                    for var_name, var_value in frame.f_locals.items():
+                        if var_name in identifiers and not var_name.startswith("_"):
                             value_repr = repr(var_value)
                             if len(value_repr) > 50:
                                 value_repr = value_repr[:47] + "..."
-                            lines.append(f"    | {var_name} = {value_repr}")
+                            write("\n    | ")
+                            write(var_name)
+                            write(" = ")
+                            write(value_repr)
         except Exception:
             pass
 
     exc_type, exc_value, _ = exc_info
     if exc_type is not None:
-        lines.append(f"{exc_type.__name__}: {exc_value}")
+        write("\n")
+        write(exc_type.__name__)
+        write(": ")
+        write(str(exc_value))
 
-    return "\n".join(lines)
+    return buf.getvalue()
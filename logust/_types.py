@@ -120,8 +120,8 @@ class HandlerConfig(TypedDict, total=False):
                      Only valid for file sinks.
         serialize: Output as JSON instead of text format.
         filter: Filter callback function.
-        enqueue: Enable async writes (default True).
-                 Only valid for file sinks.
+        enqueue: Enable async writes (default False).
+                 Valid for file and callable sinks.
         colorize: Enable ANSI color codes for console sinks.
                   If not specified, auto-detect based on TTY.
     """
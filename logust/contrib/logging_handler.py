@@ -21,10 +21,14 @@ Example:
 from __future__ import annotations
 
 import logging
+from traceback import format_exception
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from logust import Logger
+    from logust._logger import _ContextState
 
 
 class InterceptHandler(logging.Handler):
@@ -55,6 +59,9 @@ class InterceptHandler(logging.Handler):
         """
         super().__init__()
         self._target = target
+        # ``target._current``, bound on the first record. The inner logger itself is
+        # looked up per record, since ``contextualize()`` swaps it per context.
+        self._current: Callable[[], _ContextState] | None = None
 
     @property
     def target(self) -> Logger:
@@ -75,15 +82,12 @@ class InterceptHandler(logging.Handler):
 
         exception = None
         if record.exc_info:
-            import traceback
-
-            exception = "".join(traceback.format_exception(*record.exc_info))
+            exception = "".join(format_exception(*record.exc_info))
 
-        self.target._inner.log(
-            level,
-            record.getMessage(),
-            exception=exception,
-        )
+        current = self._current
+        if current is None:
+            current = self._current = self.target._current
+        current()[0].log(level, record.getMessage(), exception)
 
 
 def intercept_logging(
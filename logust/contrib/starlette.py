@@ -17,9 +17,11 @@ Example:
 
 from __future__ import annotations
 
+import codecs
+import functools
+import os
 import re
 import time
-import uuid
 from collections.abc import Callable, Mapping, MutableMapping, Sequence
 from contextlib import AbstractContextManager, nullcontext
 from contextvars import ContextVar
@@ -65,6 +67,13 @@ def get_request_id() -> str:
     return _request_id.get()
 
 
+@functools.lru_cache(maxsize=32)
+def _compile_sensitive_pattern(keys: frozenset[str]) -> re.Pattern[str]:
+    """One case-insensitive regex finding any of ``keys`` inside a field name."""
+    alternatives = sorted(keys, key=len, reverse=True)
+    return re.compile("|".join(map(re.escape, alternatives)), re.IGNORECASE)
+
+
 class RequestLoggerMiddleware(BaseHTTPMiddleware):  # type: ignore[misc,unused-ignore]
     """Middleware that logs HTTP requests and responses.
 
@@ -156,8 +165,9 @@ class RequestLoggerMiddleware(BaseHTTPMiddleware):  # type: ignore[misc,unused-i
         if max_body_size < 0:
             raise ValueError("max_body_size must be greater than or equal to 0")
 
-        self._skip_routes = set(skip_routes) if skip_routes else set()
-        self._skip_regexes = [re.compile(regex) for regex in (skip_regexes or [])]
+        self._skip_pattern, self._skip_regexes = _compile_skip_patterns(
+            skip_routes or (), skip_regexes or ()
+        )
         self._include_request_body = include_request_body
         self._max_body_size = max_body_size
         self._mask_sensitive_data = mask_sensitive_data
@@ -234,30 +244,42 @@ class RequestLoggerMiddleware(BaseHTTPMiddleware):  # type: ignore[misc,unused-i
 
     async def dispatch(self, request: Request, call_next: Callable[[Request], Any]) -> Response:
         """Process the request and log timing information."""
-        if self._should_skip(request):
+        path = request.url.path
+        if self._should_skip(path):
             return cast(Response, await call_next(request))
 
-        return await self._log_request(request, call_next)
-
-    def _should_skip(self, request: Request) -> bool:
-        """Check if this request should skip logging."""
-        path = request.url.path
+        return await self._log_request(request, call_next, path)
 
-        if any(path.startswith(route) for route in self._skip_routes):
+    def _should_skip(self, path: str) -> bool:
+        """Check if a request to ``path`` should skip logging."""
+        if self._skip_pattern is not None and self._skip_pattern.match(path):
             return True
 
         return any(regex.match(path) for regex in self._skip_regexes)
 
-    async def _log_request(self, request: Request, call_next: Callable[[Request], Any]) -> Response:
-        """Log the request and response with timing."""
-        request_id = self._get_request_id(request)
+    async def _log_request(
+        self,
+        request: Request,
+        call_next: Callable[[Request], Any],
+        path: str | None = None,
+    ) -> Response:
+        """Log the request and response with timing.
+
+        ``method``, ``path`` and the headers are read from the request once and passed on,
+        rather than looked up again by every helper.
+        """
+        if path is None:
+            path = request.url.path
+        method = request.method
+        headers = request.headers
+        request_id = self._get_request_id(headers)
         request_id_token = _request_id.set(request_id)
 
         start_time = time.perf_counter()
-        client_ip = self._get_client_ip(request)
+        client_ip = self._get_client_ip(headers, request.client)
 
         body_log = ""
-        if self._include_request_body and request.method in self._BODY_METHODS:
+        if self._include_request_body and method in self._BODY_METHODS:
             body_log = await self._get_request_body(request)
 
         holder: dict[str, Any] | None = None
@@ -268,7 +290,9 @@ class RequestLoggerMiddleware(BaseHTTPMiddleware):  # type: ignore[misc,unused-i
 
         event_context: AbstractContextManager[dict[str, Any] | None]
         if self._canonical:
-            base_event = self._build_base_event(request, request_id, client_ip, body_log)
+            base_event = self._build_base_event(
+                request, request_id, client_ip, body_log, method, path, headers
+            )
             event_context = canonical_event(base_event)
         else:
             event_context = nullcontext(None)
@@ -281,9 +305,9 @@ class RequestLoggerMiddleware(BaseHTTPMiddleware):  # type: ignore[misc,unused-i
                     holder["request"] = request
                     holder["client_ip"] = client_ip
 
-                with self.logger.contextualize(request_id=request_id, path=request.url.path):
+                with self.logger.contextualize(request_id=request_id, path=path):
                     if not self._canonical:
-                        self._log_request_start(request, client_ip, body_log)
+                        self._log_request_start(request, method, path, client_ip, body_log)
 
                     try:
                         response = cast(Response, await call_next(request))
@@ -303,7 +327,7 @@ class RequestLoggerMiddleware(BaseHTTPMiddleware):  # type: ignore[misc,unused-i
                             self._emit_canonical_event(event)
                         else:
                             self.logger.error(
-                                f"Request failed: {request.method} {request.url.path} "
+                                f"Request failed: {method} {path} "
                                 f"error={e.__class__.__name__} time={elapsed:.4f}s ip={client_ip}"
                             )
                         raise
@@ -330,7 +354,7 @@ class RequestLoggerMiddleware(BaseHTTPMiddleware):  # type: ignore[misc,unused-i
                                 holder["emitted"] = True
                             self._emit_canonical_event(event)
                         else:
-                            self._log_response(request, response, elapsed, client_ip)
+                            self._log_response(method, path, response, elapsed, client_ip)
 
                 return response
         finally:
@@ -342,22 +366,25 @@ class RequestLoggerMiddleware(BaseHTTPMiddleware):  # type: ignore[misc,unused-i
         request_id: str,
         client_ip: str,
         body: str,
+        method: str,
+        path: str,
+        headers: Mapping[str, str],
     ) -> dict[str, Any]:
         """Build canonical fields known at request start."""
         event: dict[str, Any] = {
             "event": "http.request",
             "request_id": request_id,
-            "method": request.method,
-            "path": request.url.path,
+            "method": method,
+            "path": path,
             "route": self._get_route_path(request),
             "client_ip": client_ip,
         }
 
-        user_agent = request.headers.get("user-agent")
+        user_agent = headers.get("user-agent")
         if user_agent:
             event["user_agent"] = user_agent
 
-        trace_id, span_id = self._get_trace_context(request)
+        trace_id, span_id = self._get_trace_context(headers)
         if trace_id:
             event["trace_id"] = trace_id
         if span_id:
@@ -446,9 +473,9 @@ class RequestLoggerMiddleware(BaseHTTPMiddleware):  # type: ignore[misc,unused-i
         return str(request.url.path)
 
     @staticmethod
-    def _get_trace_context(request: Request) -> tuple[str | None, str | None]:
+    def _get_trace_context(headers: Mapping[str, str]) -> tuple[str | None, str | None]:
         """Extract W3C traceparent IDs when available."""
-        traceparent = request.headers.get("traceparent")
+        traceparent = headers.get("traceparent")
         if not traceparent:
             return None, None
 
@@ -471,25 +498,19 @@ class RequestLoggerMiddleware(BaseHTTPMiddleware):  # type: ignore[misc,unused-i
             return "client_error"
         return "success"
 
-    def _log_request_start(self, request: Request, client_ip: str, body: str) -> None:
+    def _log_request_start(
+        self, request: Request, method: str, path: str, client_ip: str, body: str
+    ) -> None:
         """Log the start of a request."""
-        parts = [
-            "Request started:",
-            request.method,
-            request.url.path,
-            f"ip={client_ip}",
-        ]
-
-        if request.query_params:
-            parts.append(f"query={self._format_query_params(request.query_params)}")
-        if body:
-            parts.append(f"body={body}")
-
-        self.logger.info(" ".join(parts))
+        query_params = request.query_params
+        query = f" query={self._format_query_params(query_params)}" if query_params else ""
+        body_part = f" body={body}" if body else ""
+        self.logger.info(f"Request started: {method} {path} ip={client_ip}{query}{body_part}")
 
     def _log_response(
         self,
-        request: Request,
+        method: str,
+        path: str,
         response: Response,
         elapsed: float,
         client_ip: str,
@@ -497,7 +518,7 @@ class RequestLoggerMiddleware(BaseHTTPMiddleware):  # type: ignore[misc,unused-i
         """Log the response."""
         status = "successful" if response.status_code < 400 else "failed"
         message = (
-            f"Request {status}: {request.method} {request.url.path} "
+            f"Request {status}: {method} {path} "
             f"status={response.status_code} time={elapsed:.4f}s ip={client_ip}"
         )
 
@@ -574,7 +595,7 @@ class RequestLoggerMiddleware(BaseHTTPMiddleware):  # type: ignore[misc,unused-i
                     pass
 
     @classmethod
-    def _get_request_id(cls, request: Request) -> str:
+    def _get_request_id(cls, headers: Mapping[str, str]) -> str:
         """Honor an incoming x-request-id header, otherwise generate a new id.
 
         Incoming values are sanitized to defeat log injection: any character
@@ -582,28 +603,28 @@ class RequestLoggerMiddleware(BaseHTTPMiddleware):  # type: ignore[misc,unused-i
         is truncated to ``_MAX_INCOMING_REQUEST_ID_LEN``. Values that become
         empty after sanitization fall back to a generated id.
         """
-        incoming_id = request.headers.get("x-request-id")
+        incoming_id = headers.get("x-request-id")
         if incoming_id:
             sanitized = "".join(c for c in str(incoming_id) if 0x21 <= ord(c) <= 0x7E)
             sanitized = sanitized[: cls._MAX_INCOMING_REQUEST_ID_LEN]
             if sanitized:
                 return sanitized
-        return str(uuid.uuid4())[:8]
+        return os.urandom(4).hex()
 
     @staticmethod
-    def _get_client_ip(request: Request) -> str:
-        """Extract client IP from request headers."""
-        headers = request.headers
-
+    def _get_client_ip(headers: Mapping[str, str], client: Any) -> str:
+        """Extract client IP from request headers, else the connection's peer address."""
         forwarded_for: str | None = headers.get("x-forwarded-for")
         if forwarded_for:
-            return forwarded_for.split(",", 1)[0].strip()
+            # Only the first hop matters; slice it out without building a list
+            comma = forwarded_for.find(",")
+            return (forwarded_for[:comma] if comma != -1 else forwarded_for).strip()
 
         real_ip: str | None = headers.get("x-real-ip")
         if real_ip:
             return real_ip
 
-        return request.client.host if request.client else "unknown"
+        return client.host if client else "unknown"
 
     async def _get_request_body(self, request: Request) -> str:
         """Get and optionally mask the request body."""
@@ -618,23 +639,53 @@ class RequestLoggerMiddleware(BaseHTTPMiddleware):  # type: ignore[misc,unused-i
             if not body_bytes:
                 return ""
 
-            body_str = body_bytes.decode("utf-8", errors="ignore")
-
             if self._mask_sensitive_data:
-                body_str = self._mask_sensitive(body_str)
+                # Masking parses the whole document, so the whole body is decoded
+                body_str = self._mask_sensitive(body_bytes.decode("utf-8", errors="ignore"))
+            else:
+                body_str = self._decode_prefix(body_bytes)
             return self._truncate_body(body_str)
 
         except Exception:
             return "<body_error>"
 
+    def _decode_prefix(self, body: bytes) -> str:
+        """Decode enough of ``body`` to decide truncation, like a full decode would.
+
+        Bytes dropped by ``errors="ignore"`` produce no characters, so the body is
+        fed in slices until ``max_body_size + 1`` characters are decoded or it runs out.
+        """
+        wanted = self._max_body_size + 1
+        # A character is at most 4 UTF-8 bytes, so one slice is usually enough
+        step = wanted * 4
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+        parts: list[str] = []
+        decoded = 0
+        for start in range(0, len(body), step):
+            part = decoder.decode(body[start : start + step])
+            parts.append(part)
+            decoded += len(part)
+            if decoded >= wanted:
+                break
+        else:
+            parts.append(decoder.decode(b"", final=True))
+        return "".join(parts)
+
     def _mask_sensitive(self, body: str) -> str:
         """Mask sensitive fields in JSON body."""
         import json
 
+        from .._optional import json_loads
+
+        # No sensitive name anywhere in the text means no key to mask. A backslash
+        # could hide one behind a JSON escape (``"pass\\u0077ord"``), so such bodies
+        # are always walked. Either way the body is re-serialized below.
+        needs_mask = "\\" in body or self._sensitive_pattern().search(body) is not None
+
         try:
-            data = json.loads(body)
-            masked = self._mask_dict(data)
-            return json.dumps(masked)
+            # orjson when installed; falls back to json.loads for anything it would change
+            data = json_loads(body)
+            return json.dumps(self._mask_dict(data) if needs_mask else data)
         except (json.JSONDecodeError, TypeError):
             return body
 
@@ -651,12 +702,12 @@ class RequestLoggerMiddleware(BaseHTTPMiddleware):  # type: ignore[misc,unused-i
         except AttributeError:
             items = query_params.items()
 
+        # Resolved once per request rather than once per parameter
+        is_sensitive = self._sensitive_pattern().search if self._mask_sensitive_data else None
         formatted: dict[str, Any] = {}
         for key, value in items:
-            key_str = str(key)
-            value_to_log = (
-                "***" if self._mask_sensitive_data and self._is_sensitive_key(key_str) else value
-            )
+            key_str = key if type(key) is str else str(key)
+            value_to_log = "***" if is_sensitive is not None and is_sensitive(key_str) else value
             if key_str in formatted:
                 existing = formatted[key_str]
                 if isinstance(existing, list):
@@ -668,20 +719,50 @@ class RequestLoggerMiddleware(BaseHTTPMiddleware):  # type: ignore[misc,unused-i
         return formatted
 
     def _mask_dict(self, obj: Any) -> Any:
-        """Recursively mask sensitive fields in a dict."""
-        if isinstance(obj, dict):
-            return {
-                k: "***" if self._is_sensitive_key(k) else self._mask_dict(v)
-                for k, v in obj.items()
-            }
-        if isinstance(obj, list):
-            return [self._mask_dict(item) for item in obj]
-        return obj
+        """Copy nested dicts and lists with sensitive fields masked.
+
+        Walks with an explicit stack, so deeply nested bodies cannot hit the
+        recursion limit. Children are attached to their parent in order before
+        being filled in, which keeps key and item order.
+        """
+        if not isinstance(obj, (dict, list)):
+            return obj
+        is_sensitive = self._is_sensitive_key
+        root: Any = {} if isinstance(obj, dict) else []
+        stack: list[tuple[Any, Any]] = [(obj, root)]
+        while stack:
+            source, target = stack.pop()
+            if isinstance(source, dict):
+                for key, value in source.items():
+                    if is_sensitive(key):
+                        target[key] = "***"
+                    elif isinstance(value, (dict, list)):
+                        child: Any = {} if isinstance(value, dict) else []
+                        target[key] = child
+                        stack.append((value, child))
+                    else:
+                        target[key] = value
+            else:
+                for item in source:
+                    if isinstance(item, (dict, list)):
+                        child = {} if isinstance(item, dict) else []
+                        target.append(child)
+                        stack.append((item, child))
+                    else:
+                        target.append(item)
+        return root
+
+    def _sensitive_pattern(self) -> re.Pattern[str]:
+        """Regex matching the keys in ``_SENSITIVE_KEYS``.
+
+        Looked up from the instance on every call, so subclass overrides and
+        in-place edits of the set apply; compiled patterns are cached per key set.
+        """
+        return _compile_sensitive_pattern(frozenset(self._SENSITIVE_KEYS))
 
     def _is_sensitive_key(self, key: str) -> bool:
         """Check if a key name indicates sensitive data."""
-        key_lower = key.lower()
-        return any(sensitive in key_lower for sensitive in self._SENSITIVE_KEYS)
+        return self._sensitive_pattern().search(key) is not None
 
 
 def setup_fastapi(
@@ -696,6 +777,8 @@ def setup_fastapi(
     slow_ms: float | None = None,
     always_keep_errors: bool = True,
     sampler: TailSampler | Callable[[Mapping[str, Any]], bool] | None = None,
+    sink: str | os.PathLike[str] | Callable[[str], Any] | None = None,
+    enqueue: bool = True,
 ) -> None:
     """One-liner setup for FastAPI applications.
 
@@ -704,6 +787,7 @@ def setup_fastapi(
     - Optional canonical request events with tail sampling
     - Standard logging interception (optional)
     - Request ID contextualization
+    - An optional file or callable sink, queued off the request path by default
 
     Args:
         app: FastAPI application instance.
@@ -719,6 +803,11 @@ def setup_fastapi(
         always_keep_errors: Always keep 5xx and exception events.
         sampler: Custom canonical event sampler. When provided, it replaces
             sample_rate/slow_ms/always_keep_errors.
+        sink: File path or callable to add as a handler on the default logger.
+        enqueue: Add ``sink`` with ``enqueue=True``, so request handlers only
+            queue records and a background worker does formatting and I/O. This
+            keeps sink latency out of request latency, but records still queued
+            when the process is killed are lost; ``logger.complete()`` flushes.
 
     Example:
         >>> from fastapi import FastAPI
@@ -744,12 +833,44 @@ def setup_fastapi(
         sampler=sampler,
     )
 
+    if sink is not None:
+        from logust import logger
+
+        logger.add(sink, enqueue=enqueue)
+
     if intercept_logging:
         from .logging_handler import intercept_logging as do_intercept
 
         do_intercept()
 
 
+def _compile_skip_patterns(
+    skip_routes: Sequence[str], skip_regexes: Sequence[str]
+) -> tuple[re.Pattern[str] | None, list[re.Pattern[str]]]:
+    """Fuse skip prefixes and regexes into one alternation matched from the path start.
+
+    Regexes with capture groups (backreference numbering would shift) or global
+    inline flags (not allowed mid-pattern) cannot be fused and are returned
+    separately, to be tried one by one after the fused pattern.
+    """
+    branches = [re.escape(route) for route in dict.fromkeys(skip_routes)]
+    separate: list[re.Pattern[str]] = []
+    for source in skip_regexes:
+        regex = re.compile(source)
+        branch = f"(?:{source})"
+        if regex.groups:
+            separate.append(regex)
+            continue
+        try:
+            re.compile(branch)
+        except re.error:
+            separate.append(regex)
+            continue
+        branches.append(branch)
+    fused = re.compile("|".join(branches)) if branches else None
+    return fused, separate
+
+
 def _build_sampler(
     sample_rate: float,
     slow_ms: float | None,
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import threading
 from pathlib import Path
 from typing import Any
 
@@ -154,6 +155,22 @@ class TestCallableSinkWithSerialize:
         assert data["message"] == "JSON test"
         assert data["level"] == "INFO"
 
+    def test_callable_serialize_matches_json_dumps(self, tmp_path: Path) -> None:
+        """Test that serialized records keep json.dumps' separators and ASCII escapes."""
+        import json
+
+        inner = PyLogger(LogLevel.Trace)
+        logger = Logger(inner)
+        logger.disable()
+
+        messages: list[str] = []
+        logger.add(messages.append, serialize=True)
+
+        logger.info("héllo ✓")
+
+        assert messages[0] == json.dumps(json.loads(messages[0]))
+        assert '"message": "h\\u00e9llo \\u2713"' in messages[0]
+
 
 class TestCallableSinkWithFilter:
     """Test callable sink with filter function."""
@@ -226,6 +243,86 @@ class TestMultipleCallableSinks:
         assert "Mixed sink test" in content
 
 
+class TestEnqueuedCallableSink:
+    """Test callable sinks added with enqueue=True."""
+
+    def test_enqueued_sink_delivers_on_worker_thread(self, tmp_path: Path) -> None:
+        """Test that records reach the sink off the logging thread, in order."""
+        inner = PyLogger(LogLevel.Trace)
+        logger = Logger(inner)
+        logger.disable()
+
+        messages: list[str] = []
+        threads: set[str] = set()
+
+        def sink(msg: str) -> None:
+            threads.add(threading.current_thread().name)
+            messages.append(msg)
+
+        logger.add(sink, format="{message}", enqueue=True)
+        for i in range(300):
+            logger.info(f"msg {i}")
+        logger.complete()
+
+        assert messages == [f"msg {i}" for i in range(300)]
+        assert threading.current_thread().name not in threads
+
+    def test_enqueued_sink_applies_filter(self, tmp_path: Path) -> None:
+        """Test that the filter still runs for enqueued sinks."""
+        inner = PyLogger(LogLevel.Trace)
+        logger = Logger(inner)
+        logger.disable()
+
+        messages: list[str] = []
+        logger.add(
+            messages.append,
+            format="{message}",
+            filter=lambda record: "keep" in record["message"],
+            enqueue=True,
+        )
+        logger.info("keep me")
+        logger.info("drop me")
+        logger.complete()
+
+        assert messages == ["keep me"]
+
+    def test_remove_drains_enqueued_sink(self, tmp_path: Path) -> None:
+        """Test that removing an enqueued sink delivers what was already queued."""
+        inner = PyLogger(LogLevel.Trace)
+        logger = Logger(inner)
+        logger.disable()
+
+        messages: list[str] = []
+        handler_id = logger.add(messages.append, format="{message}", enqueue=True)
+        logger.info("queued")
+        logger.remove(handler_id)
+        logger.info("after removal")
+
+        assert messages == ["queued"]
+
+    def test_complete_waits_for_concurrent_producers(self, tmp_path: Path) -> None:
+        """Test that complete() returns only after records from every thread arrive."""
+        inner = PyLogger(LogLevel.Trace)
+        logger = Logger(inner)
+        logger.disable()
+
+        messages: list[str] = []
+        logger.add(messages.append, format="{message}", enqueue=True)
+
+        def produce(worker: int) -> None:
+            for i in range(200):
+                logger.info(f"{worker}-{i}")
+
+        producers = [threading.Thread(target=produce, args=(n,)) for n in range(4)]
+        for producer in producers:
+            producer.start()
+        for producer in producers:
+            producer.join()
+        logger.complete()
+
+        assert sorted(messages) == sorted(f"{n}-{i}" for n in range(4) for i in range(200))
+
+
 class TestCallableSinkEdgeCases:
     """Test edge cases for callable sinks."""
 
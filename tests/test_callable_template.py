@@ -6,7 +6,12 @@ efficient single-pass formatting instead of multiple .replace() calls.
 
 from __future__ import annotations
 
-from logust._template import LiteralSegment, ParsedCallableTemplate, TokenSegment
+from logust._template import (
+    LiteralSegment,
+    ParsedCallableTemplate,
+    TokenSegment,
+    get_template,
+)
 
 
 class TestParsedCallableTemplateSegments:
@@ -258,6 +263,12 @@ class TestParsedCallableTemplateEdgeCases:
         result = template.format({})
         assert result == ""
 
+    def test_literal_only_template_ignores_record(self) -> None:
+        """Templates without known tokens should return their text verbatim."""
+        template = ParsedCallableTemplate('{unknown} "quoted" \\ {{x}}')
+        assert template.format({}) == '{unknown} "quoted" \\ {{x}}'
+        assert template.format({"message": "ignored"}) == '{unknown} "quoted" \\ {{x}}'
+
     def test_adjacent_tokens(self) -> None:
         """Adjacent tokens without separator should work."""
         template = ParsedCallableTemplate("{level}{message}")
@@ -308,6 +319,51 @@ class TestParsedCallableTemplateEdgeCases:
         result = template.format(record)
         assert result == "test.py:100"
 
+    def test_invalid_spec_falls_back_per_token(self) -> None:
+        """A spec the value rejects only affects that token."""
+        template = ParsedCallableTemplate("{line:05d}|{level:<6}|")
+        result = template.format({"line": "n/a", "level": "INFO"})
+        assert result == "n/a|INFO  |"
+
+    def test_quotes_and_backslashes_in_literals_and_keys(self) -> None:
+        """Literal text and extra keys are embedded safely in the generated formatter."""
+        template = ParsedCallableTemplate("it's \"{extra[o'k]}\" \\n {message}")
+        result = template.format({"message": "hi", "extra": {"o'k": 1}})
+        assert result == 'it\'s "1" \\n hi'
+
+    def test_braces_and_control_characters_in_literals(self) -> None:
+        """Literal braces, tabs and non-ASCII text survive the generated f-string."""
+        template = ParsedCallableTemplate("{{raw}}\t\u00e9 {line:>4}|{level:{x}}")
+        result = template.format({"line": 7, "level": "INFO"})
+        assert result == "{{raw}}\t\u00e9    7|INFO}"
+
+
+class TestSegmentDispatch:
+    """Test that segment dispatch happens once, at parse time."""
+
+    def test_format_does_not_walk_segments(self) -> None:
+        """format() runs the generated formatter without revisiting segments."""
+        template = ParsedCallableTemplate("{level:<5}|{extra[k]}|{message}")
+        template._segments = ()
+        record = {"level": "INFO", "message": "hi", "extra": {"k": "v"}}
+        assert template.format(record) == "INFO |v|hi"
+
+
+class TestGetTemplate:
+    """Test the cached template factory."""
+
+    def test_same_template_returns_same_instance(self) -> None:
+        """Repeated lookups reuse the parsed template."""
+        assert get_template("{level} | {message}") is get_template("{level} | {message}")
+
+    def test_equality_and_hash_follow_template_text(self) -> None:
+        """Templates compare and hash by their source text."""
+        first = ParsedCallableTemplate("{message}")
+        second = ParsedCallableTemplate("{message}")
+        assert first == second
+        assert hash(first) == hash(second)
+        assert first != ParsedCallableTemplate("{level}")
+
 
 class TestExtraKeyPatterns:
     """Test that extra keys with special characters work."""
@@ -401,3 +457,28 @@ class TestLightweightRequirementsForRust:
     def test_lightweight_extra_keys_order_unique(self) -> None:
         t = ParsedCallableTemplate("{extra[b]} {extra[a]} {extra[b]}")
         assert t.lightweight_extra_keys_for_rust() == ("b", "a")
+
+
+class TestDefaultCallableFormat:
+    """The default callable format goes through the generated formatter."""
+
+    def test_renders_default_format(self) -> None:
+        from logust._logger import _DEFAULT_CALLABLE_FORMAT
+
+        template = get_template(_DEFAULT_CALLABLE_FORMAT)
+        record = {
+            "timestamp": "2026-01-01 00:00:00.000",
+            "level": "INFO",
+            "name": "app",
+            "function": "main",
+            "line": 12,
+            "message": "hello {world}",
+        }
+        assert template.format(record) == (
+            "2026-01-01 00:00:00.000 | INFO     | app:main:12 - hello {world}"
+        )
+
+    def test_renders_default_format_on_missing_keys(self) -> None:
+        from logust._logger import _DEFAULT_CALLABLE_FORMAT
+
+        assert get_template(_DEFAULT_CALLABLE_FORMAT).format({}) == " |          | ::0 - "
@@ -175,6 +175,45 @@ class TestCatchDecorator:
         content = log_file.read_text()
         assert "WARNING" in content
 
+    def test_catch_registered_custom_level(self, tmp_path: Path) -> None:
+        """Test catch with a level registered via logger.level()."""
+        inner = PyLogger(LogLevel.Trace)
+        logger = Logger(inner)
+        logger.disable()
+        logger.level("NOTICE", no=35)
+
+        log_file = tmp_path / "notice.log"
+        logger.add(str(log_file))
+
+        @logger.catch(Exception, level="NOTICE")
+        def risky() -> None:
+            raise RuntimeError("Notice level")
+
+        risky()
+        logger.complete()
+
+        content = log_file.read_text()
+        assert "NOTICE" in content
+        assert "Notice level" in content
+
+    def test_catch_skips_traceback_when_level_disabled(self, tmp_path: Path) -> None:
+        """Test catch does not format the traceback when no handler accepts the level."""
+        from unittest.mock import patch
+
+        inner = PyLogger(LogLevel.Trace)
+        logger = Logger(inner)
+        logger.disable()
+        logger.add(str(tmp_path / "critical.log"), level="CRITICAL")
+
+        @logger.catch(ValueError, reraise=True)
+        def risky() -> None:
+            raise ValueError("Still raised")
+
+        with patch("traceback.format_exc") as mock_format_exc:
+            with pytest.raises(ValueError, match="Still raised"):
+                risky()
+            mock_format_exc.assert_not_called()
+
     def test_catch_custom_message(self, tmp_path: Path) -> None:
         """Test catch with custom message prefix."""
         inner = PyLogger(LogLevel.Trace)
@@ -243,3 +282,31 @@ class TestCatchDecorator:
 
         with pytest.raises(TypeError, match="Should propagate"):
             risky()
+
+    def test_catch_decorator_reused_across_functions(self, tmp_path: Path) -> None:
+        """Test that one catch() result can decorate several functions."""
+        inner = PyLogger(LogLevel.Trace)
+        logger = Logger(inner)
+        logger.disable()
+
+        log_file = tmp_path / "shared.log"
+        logger.add(str(log_file))
+
+        guard = logger.catch(RuntimeError, level="WARNING")
+
+        @guard
+        def first() -> None:
+            raise RuntimeError("first failed")
+
+        @guard
+        def second() -> None:
+            raise RuntimeError("second failed")
+
+        first()
+        second()
+        logger.complete()
+
+        content = log_file.read_text()
+        assert content.count("WARNING") == 2
+        assert "first failed" in content
+        assert "second failed" in content
@@ -308,3 +308,20 @@ logger.complete()
         assert "debug msg" not in content
         assert "info msg" not in content
         assert "warning msg" in content
+
+    def test_caller_cache_tracks_globals_for_shared_code(self, tmp_path):
+        """The same code object run under different globals reports each module name."""
+        log_file = tmp_path / "test.log"
+        code = f"""
+from logust import logger
+logger.remove()
+logger.add({str(log_file)!r}, format="{{name}} - {{message}}")
+snippet = compile("logger.info('from ' + tag)", "<snippet>", "exec")
+for module_name in ("mod_a", "mod_b"):
+    exec(snippet, {{"__name__": module_name, "logger": logger, "tag": module_name}})
+logger.complete()
+"""
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+        lines = log_file.read_text().splitlines()
+        assert lines == ["mod_a - from mod_a", "mod_b - from mod_b"]
@@ -48,6 +48,34 @@ class TestConfigureHandlers:
         content = log_file.read_text()
         assert "Full config message" in content
 
+    def test_configure_file_sinks_keep_config_order(self, tmp_path: Path) -> None:
+        """File sinks around a callable sink are all registered, IDs in config order."""
+        logger = Logger(PyLogger(LogLevel.Trace))
+        logger.disable()
+        messages: list[str] = []
+        first, second, third = (tmp_path / f"{n}.log" for n in ("first", "second", "third"))
+
+        handler_ids = logger.configure(
+            handlers=[
+                {"sink": str(first), "level": "INFO"},
+                {"sink": second, "format": "{level} {message}", "retention": 3},
+                {"sink": messages.append, "format": "{message}"},
+                {"sink": third, "level": "ERROR", "filter": lambda r: "keep" in r["message"]},
+            ]
+        )
+        logger.debug("debug only")
+        logger.error("error keep")
+        logger.complete()
+
+        assert len(handler_ids) == 4
+        assert handler_ids == sorted(handler_ids)
+        assert "debug only" not in first.read_text()
+        assert "error keep" in first.read_text()
+        assert second.read_text().splitlines() == ["DEBUG debug only", "ERROR error keep"]
+        assert messages == ["debug only", "error keep"]
+        assert "error keep" in third.read_text()
+        assert logger.remove(handler_ids[1]) is True
+
 
 class TestConfigureLevels:
     """Test configure() with custom levels."""
@@ -112,6 +140,25 @@ class TestConfigurePatcher:
         assert records[0]["message"] == "Patched message"
         assert records[0]["extra"]["configured"] == "yes"
 
+    def test_configure_patcher_does_not_reach_existing_bound_loggers(self) -> None:
+        """Test that a patcher added by configure() leaves earlier bind() children alone."""
+        inner = PyLogger(LogLevel.Trace)
+        logger = Logger(inner)
+        logger.disable()
+        records: list[dict[str, Any]] = []
+        logger.add_callback(records.append)
+        child = logger.bind(user="alice")
+
+        def add_configured_tag(record: dict[str, Any]) -> None:
+            record["extra"]["configured"] = "yes"
+
+        logger.configure(patcher=add_configured_tag)
+        child.info("From child")
+        logger.info("From parent")
+
+        assert "configured" not in records[0]["extra"]
+        assert records[1]["extra"]["configured"] == "yes"
+
 
 class TestConfigureComplete:
     """Test full configure() scenarios."""
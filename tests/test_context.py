@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import threading
 from pathlib import Path
 from typing import Any
 
@@ -111,6 +113,59 @@ class TestContextualize:
         assert "Before exception" in content
         assert "After exception" in content
 
+    def test_contextualize_extra_reaches_records(self, fresh_logger: Logger) -> None:
+        """Contextualized values are attached inside the block and removed after it."""
+        logger = fresh_logger
+        records: list[dict[str, Any]] = []
+        logger.add_callback(records.append)
+
+        with logger.contextualize(request_id="abc"):
+            logger.info("inside")
+        logger.info("outside")
+
+        assert records[0]["extra"].get("request_id") == "abc"
+        assert "request_id" not in records[1]["extra"]
+
+    def test_contextualize_is_isolated_between_threads(self, fresh_logger: Logger) -> None:
+        """A block open in one thread does not leak its values into another thread."""
+        logger = fresh_logger
+        records: list[dict[str, Any]] = []
+        logger.add_callback(records.append)
+        entered = threading.Event()
+        release = threading.Event()
+
+        def worker() -> None:
+            with logger.contextualize(request_id="worker"):
+                entered.set()
+                release.wait(timeout=5)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        assert entered.wait(timeout=5)
+        logger.info("main")
+        release.set()
+        thread.join()
+
+        assert "request_id" not in records[0]["extra"]
+
+    def test_contextualize_is_isolated_between_tasks(self, fresh_logger: Logger) -> None:
+        """Interleaved asyncio tasks each keep their own contextualized values."""
+        logger = fresh_logger
+        records: list[dict[str, Any]] = []
+        logger.add_callback(records.append)
+
+        async def handle(request_id: str) -> None:
+            with logger.contextualize(request_id=request_id):
+                await asyncio.sleep(0)
+                logger.info(request_id)
+
+        async def main() -> None:
+            await asyncio.gather(handle("a"), handle("b"))
+
+        asyncio.run(main())
+
+        assert {r["message"]: r["extra"]["request_id"] for r in records} == {"a": "a", "b": "b"}
+
 
 class TestPatch:
     """Test patch() method for record modification."""
@@ -132,6 +187,19 @@ class TestPatch:
         assert records[0]["message"] == "Patched message"
         assert records[0]["extra"]["tag"] == "patched"
 
+    def test_patch_sees_upper_case_level_name(self, fresh_logger: Logger) -> None:
+        """Patchers receive the upper-case level name for built-in and custom levels."""
+        logger = fresh_logger
+        logger.level("notice", no=35)
+        logger.add_callback(lambda record: None)
+        seen: list[str] = []
+        patched = logger.patch(lambda record: seen.append(record["level"]))
+
+        patched.warning("builtin")
+        patched.log("notice", "custom")
+
+        assert seen == ["WARNING", "NOTICE"]
+
     def test_patch_chain(self, fresh_logger: Logger) -> None:
         """Test chaining multiple patchers."""
         logger = fresh_logger
@@ -0,0 +1,68 @@
+"""Tests for the log_fn / debug_fn timing decorators."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Generator
+from typing import Any
+
+import pytest
+
+from logust import logger
+from logust.contrib import debug_fn, log_fn
+
+
+@pytest.fixture
+def records() -> Generator[list[dict[str, Any]], None, None]:
+    """Capture records emitted through the global logger at DEBUG and above."""
+    captured: list[dict[str, Any]] = []
+    callback_id = logger.add_callback(captured.append, level="DEBUG")
+    yield captured
+    logger.remove_callback(callback_id)
+
+
+def test_log_fn_logs_sync_call(records: list[dict[str, Any]]) -> None:
+    @log_fn
+    def add(x: int, y: int) -> int:
+        return x + y
+
+    assert add(1, 2) == 3
+    assert len(records) == 1
+    assert records[0]["level"] == "INFO"
+    assert records[0]["message"].startswith("Called add with elapsed_time=")
+
+
+def test_log_fn_logs_async_call(records: list[dict[str, Any]]) -> None:
+    @log_fn(level="WARNING")
+    async def fetch() -> str:
+        return "data"
+
+    assert asyncio.run(fetch()) == "data"
+    assert len(records) == 1
+    assert records[0]["level"] == "WARNING"
+    assert records[0]["message"].startswith("Called fetch with elapsed_time=")
+
+
+def test_debug_fn_logs_sync_and_async_calls(records: list[dict[str, Any]]) -> None:
+    @debug_fn
+    def work() -> int:
+        return 1
+
+    @debug_fn()
+    async def async_work() -> int:
+        return 2
+
+    assert work() == 1
+    assert asyncio.run(async_work()) == 2
+    assert [r["level"] for r in records] == ["DEBUG", "DEBUG"]
+    assert records[0]["message"].startswith("Called work with elapsed_time=")
+    assert records[1]["message"].startswith("Called async_work with elapsed_time=")
+
+
+def test_log_fn_skips_disabled_level(records: list[dict[str, Any]]) -> None:
+    @log_fn(level="TRACE")
+    def work() -> int:
+        return 1
+
+    assert work() == 1
+    assert records == []
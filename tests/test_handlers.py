@@ -49,6 +49,24 @@ class TestAddHandler:
         assert "Formatted message" in content
         assert "INFO" in content
 
+    def test_add_plain_path_matches_explicit_defaults(self, tmp_path: Path) -> None:
+        """Test that add("file") writes the same lines as spelling out the defaults."""
+        inner = PyLogger(LogLevel.Trace)
+        logger = Logger(inner)
+        logger.disable()
+
+        plain = tmp_path / "plain.log"
+        explicit = tmp_path / "explicit.log"
+        logger.add(str(plain))
+        logger.add(explicit, level="DEBUG")
+
+        logger.trace("Trace message")
+        logger.info("Caller message")
+        logger.complete()
+
+        assert plain.read_text() == explicit.read_text()
+        assert "test_handlers:test_add_plain_path_matches_explicit_defaults" in plain.read_text()
+
 
 class TestRemoveHandler:
     """Test removing handlers."""
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
 from logust import Logger, LogLevel
 from logust._logust import PyLogger
 
@@ -32,6 +34,16 @@ class TestBuiltinLevels:
         assert LogLevel.Fail.value == 45
         assert LogLevel.Critical.value == 50
 
+    def test_level_name_spellings(self) -> None:
+        """Level names resolve case-insensitively; unknown names raise AttributeError."""
+        from logust._logger import _to_log_level
+
+        for spelling in ("warning", "WARNING", "Warning", "wArNiNg"):
+            assert _to_log_level(spelling) == LogLevel.Warning
+        assert _to_log_level(LogLevel.Info) == LogLevel.Info
+        with pytest.raises(AttributeError):
+            _to_log_level("notice")
+
 
 class TestCustomLevels:
     """Test custom log level registration."""
@@ -131,6 +143,18 @@ class TestIsLevelEnabled:
         assert logger.is_level_enabled("INFO") is True
         assert logger.is_level_enabled("ERROR") is True
 
+    def test_level_enabled_with_custom_level(self) -> None:
+        """Custom levels are compared by their registered number."""
+        inner = PyLogger(LogLevel.Trace)
+        logger = Logger(inner)
+        logger.remove()
+        logger.add_callback(lambda _r: None, level="WARNING")
+        logger.level("NOTICE_LOW", no=22)
+        logger.level("NOTICE_HIGH", no=35)
+
+        assert logger.is_level_enabled("NOTICE_LOW") is False
+        assert logger.is_level_enabled("NOTICE_HIGH") is True
+
     def test_is_level_enabled_callback_only_matches_callback_threshold(self) -> None:
         """Callbacks alone determine cached_min_level; no file/console handlers needed."""
         inner = PyLogger(LogLevel.Trace)
@@ -156,6 +180,37 @@ class TestIsLevelEnabled:
         assert logger.is_level_enabled(LogLevel.Debug) is False
         assert logger.is_level_enabled(LogLevel.Error) is False
 
+    def test_is_level_enabled_string_spellings_match_enum(self) -> None:
+        """String names in any case agree with the enum; unknown names still raise."""
+        inner = PyLogger(LogLevel.Trace)
+        logger = Logger(inner)
+        logger.remove()
+        logger.add_callback(lambda _r: None, level="WARNING")
+
+        for name in ("info", "INFO", "Info", "iNfO"):
+            assert logger.is_level_enabled(name) is logger.is_level_enabled(LogLevel.Info)
+        for name in ("warning", "WARNING", "Warning"):
+            assert logger.is_level_enabled(name) is True
+        with pytest.raises(AttributeError):
+            logger.is_level_enabled("nonexistent")
+
+    def test_bound_logger_sees_parent_handler_level_changes(self) -> None:
+        """Bound loggers share the cached min level with their parent."""
+        inner = PyLogger(LogLevel.Trace)
+        logger = Logger(inner)
+        logger.remove()
+        records: list[str] = []
+        logger.add_callback(lambda r: records.append(r["message"]), level="ERROR")
+        child = logger.bind(component="worker")
+
+        child.debug("dropped")
+        trace_id = logger.add_callback(lambda r: records.append(r["message"]), level="TRACE")
+        child.debug("kept")
+        logger.remove_callback(trace_id)
+        child.debug("dropped again")
+
+        assert records == ["kept"]
+
 
 class TestEnableDisable:
     """Test enable and disable methods for console output."""
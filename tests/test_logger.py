@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
 from logust import Logger
 
 
@@ -122,6 +124,24 @@ class TestException:
         assert "ERROR" in content
         assert "No exception here" in content
 
+    def test_exception_skips_traceback_when_error_disabled(self, tmp_path: Path) -> None:
+        """Test exception() does not format the traceback when ERROR is disabled."""
+        from unittest.mock import patch
+
+        from logust import LogLevel
+        from logust._logust import PyLogger
+
+        logger = Logger(PyLogger(LogLevel.Trace))
+        logger.disable()
+        logger.add(tmp_path / "critical.log", level="CRITICAL")
+
+        with patch("traceback.format_exc") as mock_format_exc:
+            try:
+                raise ValueError("ignored")
+            except ValueError:
+                logger.exception("Not logged")
+            mock_format_exc.assert_not_called()
+
 
 class TestGenericLog:
     """Test generic log() method."""
@@ -156,3 +176,71 @@ class TestGenericLog:
         assert "ERROR" in content
         assert "Error with trace" in content
         assert "Traceback here" in content
+
+
+class TestLogMany:
+    """Test batched log_many() method."""
+
+    def test_log_many_writes_all_messages(self, logger_with_file: tuple[Logger, Path]) -> None:
+        """Test log_many() writes every message in order."""
+        logger, log_file = logger_with_file
+        logger.log_many("INFO", ["first", "second", "third"])
+        logger.complete()
+
+        lines = log_file.read_text().splitlines()
+        assert [line.rsplit(" - ", 1)[-1] for line in lines] == ["first", "second", "third"]
+        assert all("INFO" in line for line in lines)
+
+    def test_log_many_numeric_level_and_generator(
+        self, logger_with_file: tuple[Logger, Path]
+    ) -> None:
+        """Test log_many() with a numeric level and a generator of non-str values."""
+        logger, log_file = logger_with_file
+        logger.log_many(30, (i for i in range(3)))
+        logger.complete()
+
+        content = log_file.read_text()
+        assert content.count("WARNING") == 3
+        assert "- 2" in content
+
+    def test_log_many_custom_level(self, logger_with_file: tuple[Logger, Path]) -> None:
+        """Test log_many() with a registered custom level."""
+        logger, log_file = logger_with_file
+        logger.level("AUDIT", no=35)
+        logger.log_many("AUDIT", ["a", "b"])
+        logger.complete()
+
+        assert log_file.read_text().count("AUDIT") == 2
+
+    def test_log_many_unknown_level_raises(self, logger_with_file: tuple[Logger, Path]) -> None:
+        """Test log_many() rejects an unknown level even for an empty batch."""
+        logger, _ = logger_with_file
+        with pytest.raises(ValueError, match="NOPE"):
+            logger.log_many("NOPE", [])
+
+    def test_log_many_runs_patchers(self, logger_with_file: tuple[Logger, Path]) -> None:
+        """Test log_many() still applies patchers to each record."""
+        logger, log_file = logger_with_file
+
+        def redact(record: dict[str, object]) -> None:
+            record["message"] = str(record["message"]).replace("secret", "***")
+
+        patched = logger.patch(redact)
+        patched.log_many("INFO", ["secret one", "secret two"])
+        logger.complete()
+
+        content = log_file.read_text()
+        assert "secret" not in content
+        assert content.count("***") == 2
+
+
+class TestLoggerLayout:
+    """Test Logger instance layout."""
+
+    def test_bound_logger_has_no_instance_dict(self, session_logger: Logger) -> None:
+        """Test bound loggers use slots rather than a per-instance __dict__."""
+        import weakref
+
+        child = session_logger.bind(request_id="abc")
+        assert not hasattr(child, "__dict__")
+        assert weakref.ref(child)() is child
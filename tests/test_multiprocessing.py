@@ -62,6 +62,13 @@ def _child_inherited_remove() -> None:
     logust.logger.remove()
 
 
+def _child_reports_process_info(path: str) -> None:
+    """Run inside a forked child: record the process info the logger reports."""
+    from logust._logger import _get_process_info
+
+    Path(path).write_text(str(_get_process_info()[1]))
+
+
 def _child_inherited_write_batch(
     start_event: multiprocessing.synchronize.Event,
     prefix: str,
@@ -671,6 +678,20 @@ class TestMultiprocessingFork:
         finally:
             logust.logger.remove(handler_id)
 
+    def test_child_process_info_is_not_inherited(self, tmp_path: Path) -> None:
+        """The cached process info must be reset in the forked child."""
+        from logust._logger import _get_process_info
+
+        assert _get_process_info()[1] == os.getpid()
+        out_file = tmp_path / "pid.txt"
+        ctx = multiprocessing.get_context("fork")
+        p = ctx.Process(target=_child_reports_process_info, args=(str(out_file),))
+        p.start()
+        exitcode = _join_process_or_fail(p, context="child process info")
+
+        assert exitcode == 0
+        assert out_file.read_text() == str(p.pid)
+
     def test_child_drops_inherited_sync_sink_without_duplicate_flush(
         self, tmp_path: Path
     ) -> None:
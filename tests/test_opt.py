@@ -47,6 +47,16 @@ class TestLazyEvaluation:
 
         assert call_count == 0
 
+    def test_lazy_mixed_arguments(self) -> None:
+        """Test that lazy formatting evaluates only callables, for any argument count."""
+        from logust._opt import OptLogger
+
+        opt = OptLogger(Logger(PyLogger(LogLevel.Trace)), lazy=True)
+
+        assert opt._format_message("{}", lambda: 1) == "1"
+        assert opt._format_message("{}-{}", 2, lambda: 3) == "2-3"
+        assert opt._format_message("{}-{}-{}", lambda: 4, 5, lambda: 6) == "4-5-6"
+
 
 class TestException:
     """Test exception auto-capture."""
@@ -77,6 +87,21 @@ class TestException:
         assert "No exception here" in content
 
 
+class TestPlainTraceback:
+    """Test the traceback formatting used when no enhancement is requested."""
+
+    def test_enhanced_without_options_matches_format_exc(self) -> None:
+        """Test format_enhanced_traceback() falls back to the stdlib output."""
+        import traceback
+
+        from logust._traceback import format_enhanced_traceback
+
+        try:
+            raise KeyError("missing")
+        except KeyError:
+            assert format_enhanced_traceback() == traceback.format_exc()
+
+
 class TestBacktrace:
     """Test backtrace extension."""
 
@@ -101,6 +126,32 @@ class TestBacktrace:
         assert "RuntimeError" in content
         assert "Deep error" in content
 
+    def test_backtrace_shows_current_source_after_edit(self, tmp_path: Path) -> None:
+        """Test that a source file edited between exceptions is re-read."""
+        import importlib.util
+
+        from logust._traceback import format_enhanced_traceback
+
+        module_file = tmp_path / "edited_module.py"
+
+        def run(source: str) -> str:
+            module_file.write_text(source)
+            spec = importlib.util.spec_from_file_location("edited_module", module_file)
+            assert spec is not None and spec.loader is not None
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            try:
+                module.fail()
+            except RuntimeError:
+                return format_enhanced_traceback(backtrace=True)
+            raise AssertionError("fail() did not raise")
+
+        output = run("def fail():\n    raise RuntimeError('first')\n")
+        assert "raise RuntimeError('first')" in output
+        output = run("def fail():\n    raise RuntimeError('second version')\n")
+        assert "raise RuntimeError('second version')" in output
+        assert "'first'" not in output
+
 
 class TestDiagnose:
     """Test variable diagnosis."""
@@ -121,6 +172,35 @@ class TestDiagnose:
         content = log_file.read_text()
         assert "ZeroDivisionError" in content
 
+    def test_diagnose_matches_whole_identifiers(self) -> None:
+        """Test that only variables named on the failing line are shown."""
+        from logust._traceback import format_enhanced_traceback
+
+        try:
+            data = {"x": 1}
+            a = "not on the line"
+            data["missing"]
+        except KeyError:
+            output = format_enhanced_traceback(diagnose=True)
+
+        assert "| data = {'x': 1}" in output
+        assert "| a = " not in output
+        assert a
+
+    def test_diagnose_truncates_repr(self) -> None:
+        """Test that long values show the first 47 characters of repr() plus '...'."""
+        from logust._traceback import format_enhanced_traceback
+
+        text = "x" * 100
+        items = list(range(30))
+        try:
+            text[0] + items[100]
+        except IndexError:
+            output = format_enhanced_traceback(diagnose=True)
+
+        assert f"| text = {repr(text)[:47]}..." in output
+        assert f"| items = {repr(items)[:47]}..." in output
+
 
 class TestOptChaining:
     """Test chaining opt() with other methods."""
@@ -137,6 +217,14 @@ class TestOptChaining:
         assert "Bound lazy: computed" in content
 
 
+class TestOptLayout:
+    """Test OptLogger instance layout."""
+
+    def test_opt_logger_has_no_instance_dict(self, session_logger: Logger) -> None:
+        """Test opt() wrappers use slots rather than a per-instance __dict__."""
+        assert not hasattr(session_logger.opt(lazy=True), "__dict__")
+
+
 class TestOptAllLevels:
     """Test opt() works with all log levels."""
 
@@ -81,6 +81,181 @@ class TestParse:
         with pytest.raises(FileNotFoundError):
             list(parse(str(tmp_path / "nonexistent.log"), r".*"))
 
+    def test_parse_pattern_with_backreference(self, tmp_path: Path) -> None:
+        """Test patterns outside RE2's syntax still work via the re fallback."""
+        log_file = tmp_path / "backref.log"
+        log_file.write_text("<b>bold</b>\n<i>mismatch</b>\n")
+
+        records = list(parse(log_file, r"<(?P<tag>\w+)>(?P<text>\w+)</(?P=tag)>"))
+
+        assert records == [{"tag": "b", "text": "bold"}]
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [r"(?P<user>\w+) (?P<action>\S+)\b", r"(?P<user>[^ ]+) (?P<action>[^ ]+)"],
+    )
+    def test_parse_non_ascii_lines(self, tmp_path: Path, pattern: str) -> None:
+        """Test non-ASCII lines match the same whether or not RE2 is installed."""
+        log_file = tmp_path / "unicode.log"
+        log_file.write_text("józef zalogował\n", encoding="utf-8")
+
+        assert list(parse(log_file, pattern)) == [{"user": "józef", "action": "zalogował"}]
+
+    def test_re2_only_compiles_unicode_neutral_patterns(self) -> None:
+        """Test patterns with Unicode-aware classes stay on re when RE2 is installed."""
+        import re
+
+        from logust._parse import _compile_regex
+
+        pytest.importorskip("re2")
+        assert isinstance(_compile_regex(r"(?P<user>\w+)"), re.Pattern)
+        assert isinstance(_compile_regex(r"[\d-]+\b"), re.Pattern)
+        assert not isinstance(_compile_regex(r"(?P<user>[^ ]+)"), re.Pattern)
+        assert not isinstance(_compile_regex(r"(?a)(?P<user>\w+)"), re.Pattern)
+
+    def test_parse_literal_prefix_and_ignorecase(self, tmp_path: Path) -> None:
+        """Test lines are prefiltered by literal prefix without breaking (?i) patterns."""
+        log_file = tmp_path / "prefix.log"
+        log_file.write_text("ERROR: disk full\nerror: lower\nINFO: fine\nERR\n")
+
+        assert list(parse(log_file, r"^ERROR: (?P<m>.*)")) == [{"m": "disk full"}]
+        assert [r["m"] for r in parse(log_file, r"(?i)error: (?P<m>.*)")] == [
+            "disk full",
+            "lower",
+        ]
+
+    def test_parse_line_endings_and_invalid_utf8(self, tmp_path: Path) -> None:
+        """Test CR, CRLF and undecodable bytes behave as in text-mode reading."""
+        log_file = tmp_path / "endings.log"
+        log_file.write_bytes(b"ERROR: a\r\nnoise\rERROR: b\rERROR: \xff\nERROR: d")
+
+        records = list(parse(log_file, r"ERROR: (?P<m>.*)"))
+
+        assert [r["m"] for r in records] == ["a", "b", "\ufffd", "d"]
+
+    def test_parse_prefix_scan_line_boundaries(self, tmp_path: Path) -> None:
+        """Test prefix-jumping finds lines at the start, middle and unterminated end."""
+        log_file = tmp_path / "scan.log"
+        log_file.write_bytes(b"ERR 1\nxERR 9\nERR\n\nERR 2\nok\nERR \xff3\nERR 4")
+
+        records = list(parse(log_file, r"ERR (?P<n>\d+)$"))
+
+        assert [r["n"] for r in records] == ["1", "2", "4"]
+
+    @pytest.mark.parametrize("block_size", [1, 3, 7, 64])
+    def test_parse_prefix_scan_across_block_boundaries(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, block_size: int
+    ) -> None:
+        """Test block-wise scanning matches text-mode reading for any block size."""
+        import re
+
+        import logust._parse
+
+        monkeypatch.setattr(logust._parse, "_SCAN_BLOCK_SIZE", block_size)
+        log_file = tmp_path / "blocks.log"
+        text = "ERR żółw 1\nxERR 9\nERR " + "ą" * 40 + "\nok\nERR 2\n"
+        log_file.write_bytes(text.encode() + b"ERR \xff\xfe 3\nERR 4\rERR 5\r\nnoise\nERR 6")
+        pattern = r"ERR (?P<m>.*)"
+
+        with log_file.open(encoding="utf-8", errors="replace") as f:
+            expected = [
+                m.groupdict() for line in f if (m := re.match(pattern, line.rstrip("\r\n")))
+            ]
+
+        assert list(parse(log_file, pattern)) == expected
+
+    def test_parse_survives_truncation_during_scan(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a file truncated mid-scan (copytruncate rotation) ends the scan cleanly."""
+        import logust._parse
+
+        monkeypatch.setattr(logust._parse, "_SCAN_BLOCK_SIZE", 16)
+        log_file = tmp_path / "live.log"
+        log_file.write_text("".join(f"ERR {i}\n" for i in range(100)))
+
+        records = parse(log_file, r"ERR (?P<n>\d+)")
+        first = next(records)
+        with log_file.open("r+b") as f:
+            f.truncate(0)
+
+        rest = [r["n"] for r in records]
+
+        # Whatever was read before the truncation is still well-formed, in order
+        assert first == {"n": "0"}
+        assert rest == [str(i) for i in range(1, len(rest) + 1)]
+
+    def test_parse_prefix_without_utf8_form(self, tmp_path: Path) -> None:
+        """Test a literal prefix with a lone surrogate falls back instead of raising."""
+        log_file = tmp_path / "surrogate.log"
+        log_file.write_text("ERR 1\n")
+
+        assert list(parse(log_file, "\ud800(?P<n>.*)")) == []
+        assert list(parse(log_file, "\ufffd(?P<n>.*)")) == []
+
+    def test_prefilter_invariants(self) -> None:
+        """Test the literal prefix and minimum length derived from patterns."""
+        from logust._parse import _prefilter
+
+        assert _prefilter(r"^ERROR: (?P<m>.*)") == ("ERROR: ", 7)
+        assert _prefilter(r"(?P<lvl>WARN)ING \d") == ("WARNING ", 9)
+        assert _prefilter(r"(?i)error") == ("", 5)
+        assert _prefilter(r"(?P<n>\d+)\|") == ("", 2)
+
+    def test_parse_caches_compiled_pattern(self, tmp_path: Path) -> None:
+        """Test repeated parse() calls reuse the compiled pattern."""
+        log_file = tmp_path / "cache.log"
+        log_file.write_text("INFO|cached\n")
+        pattern = r"(?P<level>\w+)\|(?P<message>.+)"
+
+        from logust._parse import _compile
+
+        _compile.cache_clear()
+        list(parse(log_file, pattern))
+        list(parse(log_file, pattern))
+        info = _compile.cache_info()
+
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_parse_workers_matches_sequential(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that parallel parsing yields the same records in the same order."""
+        import logust._parse
+
+        monkeypatch.setattr(logust._parse, "_PARALLEL_MIN_BYTES", 0)
+        log_file = tmp_path / "big.log"
+        lines = [f"{i}|{'ERROR' if i % 7 == 0 else 'INFO'}|message {i}" for i in range(2000)]
+        lines.insert(500, "does not match")
+        lines.insert(900, "")
+        log_file.write_bytes("\n".join(lines).encode() + b"\r\n")
+
+        pattern = r"(?P<count>\d+)\|(?P<level>\w+)\|(?P<message>.*)"
+        expected = list(parse(log_file, pattern, cast={"count": int}))
+        records = list(parse(log_file, pattern, cast={"count": int}, workers=2))
+
+        assert len(expected) == 2000
+        assert records == expected
+
+    def test_parse_workers_prefix_scan_matches_sequential(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that worker ranges scanned by literal prefix agree with sequential parsing."""
+        import logust._parse
+
+        monkeypatch.setattr(logust._parse, "_PARALLEL_MIN_BYTES", 0)
+        log_file = tmp_path / "prefixed.log"
+        lines = [f"{'ERROR' if i % 7 == 0 else 'INFO'} {i}" for i in range(2000)]
+        log_file.write_text("\n".join(lines))
+
+        pattern = r"ERROR (?P<count>\d+)"
+        expected = list(parse(log_file, pattern, cast={"count": int}))
+        records = list(parse(log_file, pattern, cast={"count": int}, workers=2))
+
+        assert [r["count"] for r in expected] == list(range(0, 2000, 7))
+        assert records == expected
+
 
 class TestParseJson:
     """Test parse_json() function for JSON log files."""
@@ -160,3 +335,13 @@ class TestParseJson:
 
         records = list(parse_json(str(log_file)))
         assert len(records) == 2
+
+    def test_parse_json_accepts_stdlib_only_values(self, tmp_path: Path) -> None:
+        """Test values outside orjson's range still decode like json.loads."""
+        log_file = tmp_path / "edge.json"
+        log_file.write_text('{"ratio": NaN}\n{"big": 123456789012345678901234567890}\n')
+
+        records = list(parse_json(log_file, strict=True))
+
+        assert records[0]["ratio"] != records[0]["ratio"]
+        assert records[1]["big"] == 123456789012345678901234567890
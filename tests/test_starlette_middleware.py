@@ -384,3 +384,61 @@ def test_max_body_size_rejects_negative_values(
     module = _load_starlette_module(monkeypatch)
     with pytest.raises(ValueError, match="max_body_size"):
         module.RequestLoggerMiddleware(object(), max_body_size=-1)
+
+
+def test_skip_routes_and_regexes_match_like_separate_checks(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    module = _load_starlette_module(monkeypatch)
+    middleware = module.RequestLoggerMiddleware(
+        object(),
+        skip_routes=["/health", "/static.v1"],
+        skip_regexes=[r"/docs", r"/(a)\1$", r"(?i)/metrics"],
+    )
+
+    def skipped(path: str) -> bool:
+        return bool(middleware._should_skip(path))
+
+    assert skipped("/health/live")
+    assert skipped("/static.v1/app.js")
+    assert not skipped("/staticxv1/app.js")
+    assert skipped("/docs/index")
+    assert not skipped("/api/docs")
+    assert skipped("/aa")
+    assert not skipped("/ab")
+    assert skipped("/METRICS")
+    assert not skipped("/api/health")
+
+
+def test_body_is_not_read_when_request_body_logging_is_off(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    module = _load_starlette_module(monkeypatch)
+    logger = CapturingLogger()
+    middleware = module.RequestLoggerMiddleware(object(), logger=logger)
+    request = _request(request_id=None)
+    request.method = "POST"
+
+    async def fail_body(_request: Any) -> str:
+        raise AssertionError("body must not be read")
+
+    monkeypatch.setattr(middleware, "_get_request_body", fail_body)
+
+    async def call_next(_request: Any) -> Any:
+        return SimpleNamespace(status_code=201)
+
+    asyncio.run(middleware._log_request(request, call_next))
+
+    assert logger.records[0][1].startswith("Request started: POST /items")
+
+
+def test_client_ip_prefers_first_forwarded_hop(monkeypatch: pytest.MonkeyPatch) -> None:
+    module = _load_starlette_module(monkeypatch)
+    get_client_ip = module.RequestLoggerMiddleware._get_client_ip
+    peer = SimpleNamespace(host="10.0.0.1")
+
+    assert get_client_ip({"x-forwarded-for": " 1.2.3.4 , 5.6.7.8"}, peer) == "1.2.3.4"
+    assert get_client_ip({"x-forwarded-for": "1.2.3.4 "}, peer) == "1.2.3.4"
+    assert get_client_ip({"x-real-ip": "9.9.9.9"}, peer) == "9.9.9.9"
+    assert get_client_ip({}, peer) == "10.0.0.1"
+    assert get_client_ip({}, None) == "unknown"
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import importlib
+import json
 import sys
 from types import ModuleType, SimpleNamespace
 from typing import Any, ClassVar
@@ -87,7 +88,7 @@ def test_request_logger_masks_sensitive_query_params(monkeypatch: pytest.MonkeyP
         ),
     )
 
-    middleware._log_request_start(request, "127.0.0.1", "")
+    middleware._log_request_start(request, request.method, request.url.path, "127.0.0.1", "")
 
     message = middleware._logger.messages[0]
     assert "SECRET_TOKEN" not in message
@@ -114,3 +115,117 @@ def test_request_logger_masks_body_before_truncating_json(
     assert "SECRET_PASSWORD" not in body
     assert '"password": "***"' in body
     assert body.endswith("...")
+
+
+def test_sensitive_keys_match_case_insensitively_and_follow_subclasses(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    module = _load_starlette_module(monkeypatch)
+    middleware = _middleware(module)
+
+    assert middleware._is_sensitive_key("X-Api-KEY")
+    assert middleware._is_sensitive_key("userPassword")
+    assert not middleware._is_sensitive_key("username")
+
+    class SsnMiddleware(module.RequestLoggerMiddleware):  # type: ignore[name-defined,misc]
+        _SENSITIVE_KEYS: ClassVar[set[str]] = {"ssn"}
+
+    custom = SsnMiddleware.__new__(SsnMiddleware)
+    assert custom._is_sensitive_key("customer_SSN")
+    assert not custom._is_sensitive_key("password")
+
+    # The set stays mutable: in-place additions and per-instance overrides apply
+    SsnMiddleware._SENSITIVE_KEYS.add("pin")
+    assert custom._is_sensitive_key("card_pin")
+    custom._SENSITIVE_KEYS = {"iban"}
+    assert custom._is_sensitive_key("IBAN")
+    assert not custom._is_sensitive_key("card_pin")
+    assert custom._mask_sensitive('{"iban": "DE00", "ok": 1}') == '{"iban": "***", "ok": 1}'
+
+
+def test_unmasked_body_truncates_like_full_decode(monkeypatch: pytest.MonkeyPatch) -> None:
+    module = _load_starlette_module(monkeypatch)
+    middleware = _middleware(module, max_body_size=5)
+    middleware._mask_sensitive_data = False
+    payload = "é€😀abcdef".encode() * 1000
+
+    class Request:
+        headers: ClassVar[dict[str, str]] = {"content-type": "text/plain"}
+
+        async def body(self) -> bytes:
+            return payload
+
+    body = asyncio.run(middleware._get_request_body(Request()))
+
+    assert body == payload.decode()[:5] + "..."
+
+
+@pytest.mark.parametrize(
+    ("payload", "expected"),
+    [
+        (b"\xff" * 100 + b"hello world here", "hello worl..."),
+        (b"\xff" * 100 + b"short", "short"),
+        (b"abc" + b"\xe2\x82" * 60 + b"defghijklm", "abcdefghij..."),
+        (b"\xf0\x9f\x98" * 50, ""),
+    ],
+    ids=["invalid-prefix", "short-after-invalid", "partial-sequences", "only-partial"],
+)
+def test_unmasked_body_skips_invalid_utf8_like_full_decode(
+    monkeypatch: pytest.MonkeyPatch, payload: bytes, expected: str
+) -> None:
+    module = _load_starlette_module(monkeypatch)
+    middleware = _middleware(module, max_body_size=10)
+    middleware._mask_sensitive_data = False
+
+    class Request:
+        headers: ClassVar[dict[str, str]] = {"content-type": "text/plain"}
+
+        async def body(self) -> bytes:
+            return payload
+
+    body = asyncio.run(middleware._get_request_body(Request()))
+
+    assert body == expected
+    assert body == middleware._truncate_body(payload.decode("utf-8", errors="ignore"))
+
+
+def test_mask_sensitive_short_circuit_and_escaped_keys(monkeypatch: pytest.MonkeyPatch) -> None:
+    module = _load_starlette_module(monkeypatch)
+    middleware = _middleware(module)
+
+    plain = '{"user":  "bob", "items": [1, 2]}'
+    assert middleware._mask_sensitive(plain) == json.dumps(json.loads(plain))
+    assert middleware._mask_sensitive("not json") == "not json"
+    escaped = middleware._mask_sensitive('{"pass\\u0077ord": "SECRET"}')
+    assert "SECRET" not in escaped
+    assert '"password": "***"' in escaped
+
+
+def test_mask_sensitive_normalizes_bodies_without_sensitive_keys(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    module = _load_starlette_module(monkeypatch)
+    middleware = _middleware(module)
+
+    pretty = json.dumps({"user": "bob", "items": [1, 2]}, indent=2)
+    masked = middleware._mask_sensitive(pretty)
+
+    assert "\n" not in masked
+    assert masked == json.dumps({"user": "bob", "items": [1, 2]})
+    assert middleware._mask_sensitive(pretty.replace('"user"', '"password"')) == json.dumps(
+        {"password": "***", "items": [1, 2]}
+    )
+
+
+def test_mask_dict_handles_deep_nesting(monkeypatch: pytest.MonkeyPatch) -> None:
+    module = _load_starlette_module(monkeypatch)
+    middleware = _middleware(module)
+    body: dict[str, Any] = {"token": "SECRET"}
+    for _ in range(5000):
+        body = {"next": [body]}
+
+    masked = middleware._mask_dict(body)
+
+    for _ in range(5000):
+        masked = masked["next"][0]
+    assert masked == {"token": "***"}
@@ -454,6 +454,35 @@ class TestConditionalInfoGathering:
             logger.info("Test message")
             mock_caller.assert_called_once()
 
+    def test_caller_info_skipped_for_callable_sink_without_caller_tokens(self) -> None:
+        """Callable sinks whose template has no caller tokens skip the frame walk."""
+        inner = PyLogger(LogLevel.Trace)
+        logger = Logger(inner)
+        logger.remove()
+
+        messages: list[str] = []
+        logger.add(messages.append, format="{time} | {level} | {message}")
+
+        with patch("logust._logger._get_caller_info") as mock_caller:
+            logger.info("Test message")
+            mock_caller.assert_not_called()
+        assert messages and messages[0].endswith("| INFO | Test message")
+
+    def test_caller_info_called_for_callable_sink_with_module_token(self) -> None:
+        """``{module}`` counts as a caller token for callable sinks."""
+        inner = PyLogger(LogLevel.Trace)
+        logger = Logger(inner)
+        logger.remove()
+
+        messages: list[str] = []
+        logger.add(messages.append, format="{module} | {message}")
+
+        with patch("logust._logger._get_caller_info") as mock_caller:
+            mock_caller.return_value = ("mod", "func", 42, "file.py")
+            logger.info("Test message")
+            mock_caller.assert_called_once()
+        assert messages == ["mod | Test message"]
+
     def test_thread_info_skipped_when_not_needed(self, tmp_path: Path) -> None:
         """_get_thread_info should not be called when not needed."""
         inner = PyLogger(LogLevel.Trace)